@@ -584,6 +584,7 @@ def extractor()-> dict[str, pl.DataFrame]:
     - Reads from predefined Excel file path: sample_mft_data.xlsx
     - Validates file existence before processing
     - Uses main DataFrame as base for creating specialized DataFrames
+    - Normalizes column names to upper case right after reading
     
     Data Processing Flow:
     1. Reads Excel file and creates main DataFrame
@@ -615,6 +616,11 @@ def extractor()-> dict[str, pl.DataFrame]:
             file_path,
             engine='openpyxl'
         )
+
+        # Normalize headers once, so every later lookup uses the upper-case names
+        main_df = main_df.rename(
+            {col: col.upper() for col in main_df.columns if not col.isupper()}
+        )
     except Exception as e:
         logger.warning("Unexpected error reading file: %s.", e)
 
@@ -20,6 +20,7 @@ responsibilities for different data loading stages. It integrates with the
 transformer module to receive cleaned and transformed data.
 
 Primary Functions:
+- `loader()`: Airflow task entry point, connects and calls load_transformed_data()
 - `load_transformed_data()`: Main entry point for data loading
 - `load_all_entity_tables()`: Loads all entity tables (supplier, part, box, etc.)
 - `load_all_junction_tables()`: Loads relationship tables
@@ -118,6 +119,9 @@ logger = get_logger(__name__)
 # Import function transformer from module transformer
 from dags.tasks.transformer import transformer
 
+# Import database connection from module connector
+from dags.tasks.connector import connect_to_database
+
 # Import database models
 from database.database import (
     SupplierData, PartData, BoxData, PalletData, ModelData,
@@ -144,8 +148,8 @@ def validate_required_columns(
         df_name: str,
         required_columns: List[str]
     ) -> bool:
-    """Validate required columns exist."""
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    """Validate required columns exist. Only the schema is inspected."""
+    missing_columns = [col for col in required_columns if col not in df.schema]
     if missing_columns:
         logger.error("DataFrame '%s' missing columns: %s", df_name, missing_columns)
         return False
@@ -782,5 +786,31 @@ def load_transformed_data(
 
     return results
 
+def loader(file_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Airflow task entry point: connects to the database and loads transformed data.
+    
+    Args:
+        file_path: Uploaded file from dag_run.conf, passed by the DAG
+        
+    Returns:
+        Dictionary with loading results
+        
+    Raises:
+        RuntimeError: If loading failed, so Airflow marks the task as failed
+    """
+    logger.info("Loader task started for file: %s", file_path)
+
+    engine = connect_to_database(create_tables=True)
+    try:
+        results = load_transformed_data(engine)
+    finally:
+        engine.dispose()
+
+    if not results['success']:
+        raise RuntimeError(f"Data loading failed: {results['error']}")
+
+    return results
+
 if __name__ == '__main__':
-    load_transformed_data()
+    loader()
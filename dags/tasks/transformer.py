@@ -7,20 +7,28 @@ and data quality improvements for multiple DataFrames containing supplier, part,
 packaging, and production data.
 
 Main Components:
-- convert_to_int64(): Converts to nullable integer type with None handling
-- convert_to_string(): Converts to string type with missing value preservation
-- convert_to_float(): Converts to float with 2-decimal rounding
-- clean_text_column(): Universal text cleaning with Chinese detection and CamelCase processing
-- apply_transformations(): Applies transformation dictionaries to DataFrames
+- int64_expr(): Converts to nullable integer type with None handling
+- string_expr(): Converts to string type with missing value preservation
+- decimal_expr(): Builds fixed point Decimal converters for Numeric columns
+- enum_expr(): Builds Enum converters from the database enum types
+- packaging_number_expr(): Builds BOX_NUMBER / PALLET_NUMBER from type and dimensions
+- titlecase_series(): Title case with an ASCII fast path via PyArrow, skipping titled values
+- clean_via_unique(): Cleans distinct values only and broadcasts the results
+- clean_text_series(): Universal text cleaning with Chinese detection and CamelCase processing
+- clean_text_expr(): Expression wrapper around clean_text_series()
+- convert_to_*() / clean_text_column(): DataFrame wrappers around the expression builders
+- find_failing_columns(): Bisects a failed plan to the offending expressions
+- apply_transformations(): Applies transformation dictionaries to DataFrames in one pass
+- process_dataframe(): Transforms one DataFrame with error handling
 - transformer(): Main function coordinating all data transformations
 
 Key Features:
-- Type conversion functions for Int64, string, and float data types
+- Type conversion functions for Int64, string, Decimal and Enum data types
 - Automatic Chinese character detection and pinyin conversion
 - Multilingual CamelCase text processing (Cyrillic and Latin)
 - Punctuation removal and text normalization
 - Comprehensive error handling and logging
-- Batch processing of multiple DataFrames
+- Batch processing of multiple DataFrames in a thread pool
 
 Data Sources:
 - Processes DataFrames from extractor module including:
@@ -35,6 +43,7 @@ Data Sources:
 
 Dependencies:
 - polars: Data manipulation and transformation
+- pyarrow: ASCII title case kernel for the text cleaning fast path, pandas bridge
 - pypinyin: Chinese character to pinyin conversion
 - re: Regular expressions for text processing
 - logging: Application logging and error tracking
@@ -59,11 +68,19 @@ License: MIT
 Status: Production
 """
 from pathlib import Path
+import os
 import sys
 import re
-from typing import Callable, Dict
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List
 import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
 from pypinyin import lazy_pinyin
+from pypinyin.pinyin_dict import pinyin_dict
 
 # The relative path to the root project directory
 project_path = Path(__file__).resolve().parents[2]
@@ -79,125 +96,386 @@ logger = get_logger(__name__)
 # Import function extractor from module extractor.py
 from dags.tasks.extractor import extractor
 
+# Import enum types from module database.py
+from sqlalchemy.types import Enum as SqlEnum
+from database.database import (
+    localization_enum, packaging_type_enum, model_codes_enum,
+    model_names_enum, workshop_codes_enum, workshop_names_enum
+)
+
+# Regex patterns of the text cleaning chain, shared by every call
+_CAMEL_UPPER = sys.intern(r"([A-ZА-ЯЁ])")
+_NUMBER = sys.intern(r"(\d+(?:\.\d+)?)")
+_WHITESPACE = sys.intern(r"\s+")
+_NON_ASCII = sys.intern(r"[^\x00-\x7f]")
+_NOT_TITLECASE = sys.intern(r"(^|\P{L})\p{Ll}|\p{L}[\p{Lu}\p{Lt}]")
+# Chinese character range (basic and extended)
+_CHINESE = sys.intern(r"[\u4e00-\u9fff\u3400-\u4dbf\uf900-\ufaff]")
+# Special characters replaced by spaces, merged with whitespace into one class
+_SPECIAL_CHARS = re.escape(r"-)(][.,;:_/\|+*&^%$#@!~`\"'<>?{}")
+_SEPARATORS = sys.intern(rf"[{_SPECIAL_CHARS}\s]+")
+
+# Raw text -> cleaned text, shared by all DataFrames of one transformer() run.
+# The worker threads of transformer() access it under _clean_text_lock
+_clean_text_cache: Dict[str, str] = {}
+_clean_text_lock = threading.Lock()
+
+
+def _toneless(reading: str) -> str:
+    '''Convert a tone-marked pinyin reading to the lazy_pinyin() default style'''
+    reading = unicodedata.normalize('NFD', reading).replace('u\u0308', 'v')
+    return ''.join(char for char in reading if not unicodedata.combining(char))
+
+
+# Characters with a single reading are translated by table lookup; the
+# polyphonic ones need the phrase segmentation of lazy_pinyin()
+_CHAR_PINYIN = {
+    chr(code): _toneless(reading)
+    for code, reading in pinyin_dict.items() if ',' not in reading
+}
+_POLYPHONIC = frozenset(
+    chr(code) for code, reading in pinyin_dict.items() if ',' in reading
+)
+
+
+@lru_cache(maxsize=100_000)
+def _pinyin(text: str) -> str:
+    '''Convert Chinese characters to pinyin, cached across transformer() runs'''
+    try:
+        if any(char in _POLYPHONIC for char in text):
+            return ''.join(lazy_pinyin(text))
+        return ''.join(_CHAR_PINYIN.get(char, char) for char in text)
+    except Exception:
+        return text
 
-def convert_to_int64(df: pl.DataFrame, col: str) -> pl.DataFrame:
+
+def titlecase_series(s: pl.Series) -> pl.Series:
+    '''
+    Function applies title case to a string Series, touching only the values
+    that are not title case yet and routing ASCII-only values through the
+    PyArrow ASCII kernel and the rest through the Unicode-aware Polars kernel.
+
+    Arguments:
+    - s: polars Series of Utf8 values
+
+    Returns:
+    - titled: Series with title case applied, nulls preserved
+
+    Notes:
+    - A value needs title case if a word starts with a lower case letter or a
+      capital follows another letter; all other values are returned as is
+    - After pinyin conversion most cleaned values are plain ASCII, so the
+      Unicode lookup tables are only needed for the remaining rows
+    - Results are identical to pl.Expr.str.to_titlecase()
     '''
-    Function converts column data to nullable Int64 type (polars integer with null support)
-    and handles conversion from various numeric and string types.
+    needs_titlecase = s.str.contains(_NOT_TITLECASE).fill_null(False)
+    if not needs_titlecase.any():
+        return s
+
+    subset = s.filter(needs_titlecase)
+    titled = pl.Series(s.name, pc.ascii_title(subset.to_arrow()), dtype=pl.Utf8)
+
+    # Cyrillic and other non-ASCII values need the Unicode-aware kernel
+    non_ascii = subset.str.contains(_NON_ASCII)
+    if non_ascii.any():
+        titled = titled.scatter(non_ascii.arg_true(), subset.filter(non_ascii).str.to_titlecase())
+
+    return s.clone().scatter(needs_titlecase.arg_true(), titled)
+
+
+def int64_expr(col: str, dtype: pl.DataType) -> pl.Expr:
+    '''
+    Function builds an expression converting column data to nullable Int64 type
+    (polars integer with null support) from various numeric and string types.
     
     Arguments:
-    - df: polars DataFrame instance to be modified
     - col: Column name to convert to Int64 type
+    - dtype: Current polars dtype of the column
     
     Returns:
-    - df: Modified DataFrame with converted column
+    - expr: Expression producing the converted column
     
     Notes:
     - Uses pl.Int64 which supports null values
     - Preserves null values for missing data
+    - String columns are stripped of surrounding whitespace before the cast
     - Suitable for integer columns that may contain missing values
+    - Columns that are already Int64 are returned as an identity expression
     '''
-    try:
-        # Check if column exists
-        if col not in df.columns:
-            logger.warning("Column '%s' not found in DataFrame", col)
-            return df
-
-        # Convert to Int64, handling nulls appropriately
-        df = df.with_columns(
-            pl.col(col).cast(pl.Int64, strict=False).alias(col)
-        )
+    # Nothing to convert
+    if dtype == pl.Int64:
+        return pl.col(col)
 
-    except (pl.exceptions.ComputeError, pl.exceptions.ColumnNotFoundError) as e:
-        logger.warning("Error converting column '%s' to Int64: %s", col, e)
+    # Branch on the source dtype so the conversion is a single expression
+    if dtype == pl.Utf8:
+        expr = pl.col(col).str.strip_chars().cast(pl.Int64, strict=False)
+    else:
+        expr = pl.col(col).cast(pl.Int64, strict=False)
 
-        # Fallback: try to convert via string
-        try:
-            df = df.with_columns(
-                pl.col(col).cast(pl.Utf8).str.strip_chars().cast(pl.Int64, strict=False).alias(col)
-            )
-
-        except Exception as fallback_error:
-            logger.error("Fallback conversion also failed for column '%s': %s", col, fallback_error)
-
-    return df
+    return expr.alias(col)
 
 
-def convert_to_string(df: pl.DataFrame, col: str) -> pl.DataFrame:
+def string_expr(col: str, dtype: pl.DataType) -> pl.Expr:
     '''
-    Function converts column data to string type (Utf8) and preserves null values.
-    Safely handles various data types including numeric, boolean, and datetime values.
+    Function builds an expression converting column data to string type (Utf8)
+    and preserving null values. Safely handles various data types including
+    numeric, boolean, and datetime values.
     
     Arguments:
-    - df: polars DataFrame instance to be modified
     - col: Column name to convert to string type
+    - dtype: Current polars dtype of the column
     
     Returns:
-    - df: Modified DataFrame with converted column
+    - expr: Expression producing the converted column
     
     Notes:
     - Converts non-null values to string using cast to Utf8
     - Preserves null values
     - Suitable for text columns that may contain mixed data types
+    - Columns that are already Utf8 are returned as an identity expression
     '''
-    try:
-        if col not in df.columns:
-            logger.warning("Column '%s' not found in DataFrame", col)
-            return df
+    # Nothing to convert
+    if dtype == pl.Utf8:
+        return pl.col(col)
 
-        # Convert to string type (Utf8 in polars)
-        df = df.with_columns(
-            pl.col(col).cast(pl.Utf8, strict=False).alias(col)
-        )
+    # Convert to string type (Utf8 in polars)
+    return pl.col(col).cast(pl.Utf8, strict=False).alias(col)
 
-    except (pl.exceptions.ComputeError, pl.exceptions.ColumnNotFoundError) as e:
-        logger.warning("Error converting column '%s' to string: %s", col, e)
 
-    return df
+def decimal_expr(precision: int, scale: int) -> Callable[[str, pl.DataType], pl.Expr]:
+    '''
+    Function creates an expression builder converting column data to a fixed
+    point Decimal matching a database Numeric(precision, scale) column.
+    
+    Arguments:
+    - precision: Total number of digits
+    - scale: Number of digits after the decimal point
+    
+    Returns:
+    - builder: Expression builder with the (col, dtype) signature of the other converters
+    
+    Notes:
+    - Values are rounded to the scale, so they reach the database without a
+      driver-side float -> Decimal conversion
+    - String columns are stripped of surrounding whitespace before the cast
+    - Non-numeric values and values that do not fit the precision become null;
+      they are counted by builder.unmapped() and reported by apply_transformations()
+    '''
+    decimal_dtype = pl.Decimal(precision, scale)
+    limit = 10 ** (precision - scale)
+
+    def source(col: str, dtype: pl.DataType) -> pl.Expr:
+        if dtype == pl.Utf8:
+            value = pl.col(col).str.strip_chars().cast(pl.Float64, strict=False)
+        else:
+            value = pl.col(col).cast(pl.Float64, strict=False)
+        return value.round(scale)
+
+    def builder(col: str, dtype: pl.DataType) -> pl.Expr:
+        # Nothing to convert
+        if dtype == decimal_dtype:
+            return pl.col(col)
+
+        # Out of range values would make the cast fail
+        value = source(col, dtype)
+        return pl.when(value.abs() < limit).then(value).cast(decimal_dtype).alias(col)
+
+    def unmapped(col: str, dtype: pl.DataType) -> pl.Expr:
+        # Non-blank values the builder turns into null
+        if dtype == decimal_dtype:
+            return pl.lit(0)
+        if dtype == pl.Utf8:
+            present = pl.col(col).str.strip_chars() != ""
+        else:
+            present = pl.col(col).is_not_null()
+        fits = (source(col, dtype).abs() < limit).fill_null(False)
+        return (present & ~fits).sum()
+
+    builder.__name__ = f"decimal_expr({precision}, {scale})"
+    builder.unmapped = unmapped
+    return builder
+
+
+# Source spellings of enum values, keyed by the database enum type name
+ENUM_ALIASES: Dict[str, Dict[str, str]] = {
+    'packaging_type': {
+        'n_returnable': 'non-returnable',
+        'non_returnable': 'non-returnable',
+        'nonreturnable': 'non-returnable'
+    },
+    'workshop_names': {
+        'Paint': 'Painting'
+    }
+}
+
+
+def enum_mapping(sql_enum: SqlEnum) -> Dict[str, str]:
+    '''
+    Function builds the source value -> enum value mapping of a database enum type:
+    every category maps onto itself, plus the known spellings from ENUM_ALIASES.
+    '''
+    mapping = {value: value for value in sql_enum.enums}
+    mapping.update(ENUM_ALIASES.get(sql_enum.name, {}))
+    return mapping
 
 
-def convert_to_float(df: pl.DataFrame, col: str) -> pl.DataFrame:
+def enum_expr(sql_enum: SqlEnum) -> Callable[[str, pl.DataType], pl.Expr]:
     '''
-    Function converts column data to Float64 type with 2 decimal places rounding
-    and preserves null values. Handles numeric conversion safely.
+    Function creates an expression builder converting column data to a polars Enum
+    with the categories of a database enum type.
     
     Arguments:
-    - df: polars DataFrame instance to be modified
-    - col: Column name to convert to float type
+    - sql_enum: SQLAlchemy Enum type from database.py defining the allowed values
     
     Returns:
-    - df: Modified DataFrame with converted column
+    - builder: Expression builder with the (col, dtype) signature of the other converters
     
     Notes:
-    - Rounds numeric values to 2 decimal places using round(2)
-    - Preserves null values
-    - Correctly handles conversion errors by replacing non-numeric values with Null
-    - Suitable for monetary values, measurements, and other decimal data
+    - Categories are taken from the database enum, so both stay in sync
+    - Values are stripped of surrounding whitespace before matching
+    - Source spellings listed in ENUM_ALIASES are mapped onto their category
+    - Blank values and values outside the mapping become null; the latter are
+      counted by builder.unmapped() and reported by apply_transformations()
+    - Stored as UInt32 physical codes instead of one string per row
     '''
-    try:
-        if col not in df.columns:
-            logger.warning("Column '%s' not found in DataFrame", col)
-            return df
+    mapping = enum_mapping(sql_enum)
+    enum_dtype = pl.Enum(list(sql_enum.enums))
 
-        # Convert to Float64 and round to 2 decimal places
-        df = df.with_columns(
-            pl.col(col).cast(pl.Float64, strict=False).round(2).alias(col)
-        )
+    def source(col: str) -> pl.Expr:
+        return pl.col(col).cast(pl.Utf8, strict=False).str.strip_chars()
 
-    except (pl.exceptions.ComputeError, pl.exceptions.ColumnNotFoundError) as e:
-        logger.warning("Error converting column '%s' to float: %s", col, e)
+    def builder(col: str, dtype: pl.DataType) -> pl.Expr:
+        return source(col).replace_strict(mapping, default=None, return_dtype=enum_dtype).alias(col)
 
-        # If conversion fails, set entire column to null
-        try:
-            df = df.with_columns(pl.lit(None).cast(pl.Float64).alias(col))
+    def unmapped(col: str, dtype: pl.DataType) -> pl.Expr:
+        # Non-blank values the builder turns into null
+        value = source(col)
+        return (value.is_not_null() & (value != "") & ~value.is_in(list(mapping))).sum()
 
-        except Exception as null_error:
-            logger.error("Failed to set column '%s' to float: %s", col, null_error)
+    builder.__name__ = f"enum_expr({sql_enum.name})"
+    builder.unmapped = unmapped
+    return builder
 
-    return df
 
+def packaging_number_expr(prefix: str) -> Callable[[str, pl.DataType], pl.Expr]:
+    '''
+    Function creates an expression builder for BOX_NUMBER / PALLET_NUMBER that
+    keeps numbers present in the source and builds the missing ones from the
+    packaging type and dimensions.
+    
+    Arguments:
+    - prefix: Column prefix of the packaging entity ('BOX' or 'PALLET')
+    
+    Returns:
+    - builder: Expression builder with the (col, dtype) signature of the other converters
+    
+    Notes:
+    - Format: 'A 1340-560-440' for non-returnable, 'B 1340-560-440' otherwise
+    - The packaging type is matched after the same alias mapping as enum_expr,
+      so 'n_returnable' counts as non-returnable
+    - Blank and whitespace-only source numbers are treated as missing
+    - Dimensions are read as integers, so '560.0' and ' 560' both give '560'
+    - The number stays null if any dimension is missing
+    '''
+    def dimension(col: str) -> pl.Expr:
+        return (
+            pl.col(col).cast(pl.Utf8, strict=False).str.strip_chars()
+            .cast(pl.Float64, strict=False).cast(pl.Int64, strict=False)
+            .cast(pl.Utf8)
+        )
 
-def clean_text_column(df: pl.DataFrame, col: str) -> pl.DataFrame:
+    packaging_type = (
+        pl.col(f"{prefix}_TYPE").cast(pl.Utf8, strict=False).str.strip_chars()
+        .replace_strict(enum_mapping(packaging_type_enum), default=None)
+    )
+    generated = pl.concat_str([
+        pl.when(packaging_type == "non-returnable").then(pl.lit("A ")).otherwise(pl.lit("B ")),
+        dimension(f"{prefix}_LENGTH_MM"),
+        pl.lit("-"),
+        dimension(f"{prefix}_WIDTH_MM"),
+        pl.lit("-"),
+        dimension(f"{prefix}_HEIGHT_MM")
+    ])
+
+    def builder(col: str, dtype: pl.DataType) -> pl.Expr:
+        number = string_expr(col, dtype)
+        present = pl.when(number.str.strip_chars() != "").then(number)
+        return pl.coalesce(present, generated).alias(col)
+
+    builder.__name__ = f"packaging_number_expr({prefix})"
+    return builder
+
+
+def clean_via_unique(
+        s: pl.Series,
+        clean_fn: Callable[[pl.Series], pl.Series],
+        cache: Dict[str, str] | None = None
+) -> pl.Series:
+    '''
+    Function applies a cleaning function to the distinct values of a Series only
+    and broadcasts the results back to every row.
+    
+    Arguments:
+    - s: polars Series to clean
+    - clean_fn: Function cleaning a Series of distinct non-null values
+    - cache: Optional raw -> cleaned dict; values found in it are not cleaned
+      again and new results are added to it
+    
+    Returns:
+    - cleaned: Utf8 Series with cleaned values, nulls preserved
+    
+    Notes:
+    - Name-like columns repeat a few distinct values over many rows, so the
+      cleaning work shrinks by the deduplication ratio
+    - The shared cache is only read and written under _clean_text_lock;
+      clean_fn itself runs outside the lock
+    '''
+    if cache is None:
+        cache = {}
+
+    # Only values not cleaned before go through clean_fn
+    unique_values = s.unique().drop_nulls()
+    values = unique_values.to_list()
+    with _clean_text_lock:
+        pending = [value for value in values if value not in cache]
+    cleaned = clean_fn(pl.Series(s.name, pending, dtype=unique_values.dtype)).to_list()
+
+    # Broadcast the cleaned unique values back to every row
+    with _clean_text_lock:
+        cache.update(zip(pending, cleaned))
+        mapping = {value: cache[value] for value in values}
+    return s.replace_strict(mapping, return_dtype=pl.Utf8)
+
+
+def _clean_text_chain(values: pl.Series) -> pl.Series:
+    '''Run the pinyin and regex cleaning chain of clean_text_series() on distinct values'''
+    col = values.name
+
+    # Detect Chinese text in Polars; only those values reach pypinyin
+    chinese_values = values.filter(values.str.contains(_CHINESE))
+    pinyin_mapping = {value: _pinyin(value) for value in chinese_values.to_list()}
+
+    # Apply transformations
+    return values.to_frame(col).select(
+        pl.col(col)
+        # Step 1: Convert Chinese characters to pinyin if present
+        .replace(pinyin_mapping)
+        # Step 2: Split CamelCase for both Cyrillic and Latin by putting a space
+        # before every capital (also covers lowerCamelCase, e.g. "engineMount")
+        .str.replace_all(_CAMEL_UPPER, r" $1")
+        # Step 3: Separate numbers from text (including decimals)
+        .str.replace_all(_NUMBER, r" $1 ")
+        # Step 4: Replace runs of special characters and whitespace with one space
+        .str.replace_all(_SEPARATORS, " ")
+        # Step 5: Trim leading/trailing spaces
+        .str.strip_chars()
+        # Step 6: Apply title case (ASCII fast path)
+        .map_batches(titlecase_series, return_dtype=pl.Utf8)
+        .alias(col)
+    ).get_column(col)
+
+
+def clean_text_series(s: pl.Series) -> pl.Series:
     '''
     Universal text cleaning function that applies appropriate transformations
     based on content detection.
@@ -209,75 +487,27 @@ def clean_text_column(df: pl.DataFrame, col: str) -> pl.DataFrame:
     4. Always removes punctuation, normalizes spaces, and applies title case
     
     Arguments:
-    - df: polars DataFrame instance to be modified
-    - col: Column name containing text to clean
+    - s: polars Series containing text to clean
     
     Returns:
-    - df: Modified DataFrame with cleaned text
+    - cleaned: Series with cleaned text, or the basic fallback cleaning on error
     
     Notes:
     - Automatically detects Chinese characters in text
     - Preserves null values
     - Handles multilingual text (Cyrillic, Latin, Chinese)
+    - Cleans each distinct value once per transformer() run; results are
+      cached and reused by every column and DataFrame holding the same text
 
     Raises:
     pl.exceptions.ComputeError: If Polars computation fails
     re.error: If regex pattern compilation fails
     ImportError: If pypinyin import fails
     '''
-
-    # Define special characters to remove
-    special_chars = re.escape(r"-)(][.,;:_/\|+*&^%$#@!~`\"'<>?{}")
-
-    # Define Chinese character range (basic and extended)
-    chinese_pattern = re.compile(r'[\u4e00-\u9fff\u3400-\u4dbf\uf900-\ufaff]')
+    col = s.name
 
     try:
-        if col not in df.columns:
-            logger.warning("Column '%s' not found in DataFrame", col)
-            return df
-
-        # Helper function for Chinese to pinyin conversion
-        def chinese_to_pinyin(name: str) -> str:
-            '''Convert Chinese characters to pinyin'''
-            if name is None:
-                return None
-            try:
-                return ''.join(lazy_pinyin(name))
-            except Exception:
-                return name
-
-        # Helper function to detect if text contains Chinese characters
-        def contains_chinese(text: str) -> bool:
-            '''Check if text contains Chinese characters'''
-            if text is None:
-                return False
-            return bool(chinese_pattern.search(text))
-
-        # Apply transformations
-        df = df.with_columns(
-            pl.col(col)
-            # Step 1: Convert Chinese characters to pinyin if present
-            .map_elements(
-                lambda x: chinese_to_pinyin(x) if x and contains_chinese(x) else x,
-                return_dtype=pl.Utf8
-            )
-            # Step 2: Handle lowerCamelCase (e.g., "engineMount" → "engine Mount")
-            .str.replace_all(r"([a-z])([A-Z])", r"$1 $2")
-            # Step 3: Handle UpperCamelCase for both Cyrillic and Latin
-            .str.replace_all(r"([A-ZА-ЯЁ][^A-ZА-ЯЁ]*)", r" $1")
-            # Step 4: Separate numbers from text (including decimals)
-            .str.replace_all(r"(\d+(?:\.\d+)?)", r" $1 ")
-            # Step 5: Remove all special characters
-            .str.replace_all(f"[{special_chars}\n\t]", " ")
-            # Step 6: Normalize multiple spaces to single space
-            .str.replace_all(r"\s+", " ")
-            # Step 7: Trim leading/trailing spaces
-            .str.strip_chars()
-            # Step 8: Apply title case
-            .str.to_titlecase()
-            .alias(col)
-        )
+        s = clean_via_unique(s, _clean_text_chain, _clean_text_cache)
 
         logger.debug("Successfully cleaned text column '%s'", col)
 
@@ -287,12 +517,10 @@ def clean_text_column(df: pl.DataFrame, col: str) -> pl.DataFrame:
         # Apply basic cleaning as fallback
         logger.info("Applying basic cleaning as fallback for column '%s'", col)
         try:
-            df = df.with_columns(
-                pl.col(col)
-                .str.replace_all(r"\s+", " ")
+            s = (
+                s.str.replace_all(_WHITESPACE, " ")
                 .str.strip_chars()
                 .str.to_titlecase()
-                .alias(col)
             )
 
         except Exception as fallback_error:
@@ -301,69 +529,377 @@ def clean_text_column(df: pl.DataFrame, col: str) -> pl.DataFrame:
                 col, fallback_error
             )
 
-    return df
+    return s
 
 
-def apply_transformations(df: pl.DataFrame, transformations: Dict[str, Callable]) -> pl.DataFrame:
+def clean_text_expr(col: str, dtype: pl.DataType) -> pl.Expr:
+    '''
+    Function builds an expression applying clean_text_series() to a column.
+    
+    Arguments:
+    - col: Column name containing text to clean
+    - dtype: Current polars dtype of the column
+    
+    Returns:
+    - expr: Expression producing the cleaned column
+    '''
+    return pl.col(col).map_batches(clean_text_series, return_dtype=pl.Utf8).alias(col)
+
+
+def convert_to_int64(df: pl.DataFrame, col: str) -> pl.DataFrame:
+    '''
+    Function converts a DataFrame column to nullable Int64 type (see int64_expr()).
+    '''
+    return df.with_columns(int64_expr(col, df.schema[col]))
+
+
+def convert_to_string(df: pl.DataFrame, col: str) -> pl.DataFrame:
+    '''
+    Function converts a DataFrame column to string type (see string_expr()).
+    '''
+    return df.with_columns(string_expr(col, df.schema[col]))
+
+
+def clean_text_column(df: pl.DataFrame, col: str) -> pl.DataFrame:
+    '''
+    Function cleans a DataFrame text column (see clean_text_series()).
+    '''
+    return df.with_columns(clean_text_expr(col, df.schema[col]))
+
+
+def find_failing_columns(lf: pl.LazyFrame, exprs: Dict[str, pl.Expr]) -> List[str]:
+    '''
+    Function locates the expressions that fail to evaluate on a LazyFrame by
+    bisection, so a single bad column costs about log2(N) probes instead of N.
+    
+    Arguments:
+    - lf: LazyFrame the expressions are evaluated against
+    - exprs: Dict[str, pl.Expr] in the format {column_name: expression}
+    
+    Returns:
+    - failing_columns: Names of the columns whose expression fails
+    
+    Notes:
+    - Each probe selects only the expressions under test, so Polars reads
+      just the columns they need
+    '''
+    try:
+        lf.select(list(exprs.values())).collect()
+        return []
+
+    except pl.exceptions.PolarsError:
+        if len(exprs) == 1:
+            return list(exprs)
+
+    items = list(exprs.items())
+    middle = len(items) // 2
+    return (
+        find_failing_columns(lf, dict(items[:middle]))
+        + find_failing_columns(lf, dict(items[middle:]))
+    )
+
+
+def apply_transformations(
+        df: pl.DataFrame | pl.LazyFrame,
+        transformations: Dict[str, Callable],
+        project: bool = False
+) -> pl.DataFrame:
     """
-    Function applies a set of transformation functions to specified columns in a DataFrame.
-    Safely processes each transformation with error handling and continues processing
-    other columns even if individual transformations fail.
+    Function applies a set of transformation expressions to specified columns in a DataFrame.
+    All expressions run in a single lazy with_columns() and the frame is collected once
+    with the streaming engine, so Polars can evaluate the columns in parallel.
     
     Arguments:
-    - df: Original polars DataFrame instance to be transformed
-    - transformations: Dict[str, Callable[[pl.DataFrame, str], pl.DataFrame]]
-    - Format: {column_name: transformation_function}
+    - df: Original polars DataFrame or LazyFrame instance to be transformed
+    - transformations: Dict[str, Callable[[str, pl.DataType], pl.Expr]]
+    - Format: {column_name: expression_builder}
+    - project: If True, keep only the columns listed in transformations
     
     Returns:
     - result_df: New DataFrame instance with applied transformations
     
     Notes:
-    - Creates a copy of the original DataFrame to avoid modifying source data
+    - The source DataFrame is never modified
     - Skips columns that are not present in the DataFrame
-    - Continues processing other columns if a transformation fails for one column
+    - A builder that fails leaves its column unchanged (identity expression)
+    - Identity expressions are dropped from the plan, so columns that already have
+      the target dtype are not touched at all
+    - If the fused plan fails to collect, the failing columns are located by
+      bisection (see find_failing_columns()) and keep their original values
     - Logs detailed warnings for failed transformations with column names
-    - Preserves original column values if transformation fails
+    - Logs the number of values enum and decimal conversions turn into null, per column
+    - With project=True untouched columns are dropped before any conversion runs
+    - The streaming engine processes the plan in batches, which bounds peak memory
+      for large inputs
     """
-    result_df = df.clone()
-    successful_transformations = 0
+    # Schema lookup, built once for the whole frame
+    schema = df.collect_schema()
+    exprs = {}
     failed_transformations = 0
     skipped_columns = 0
 
     for col, func in transformations.items():
-        if col not in result_df.columns:
+        if col not in schema:
             logger.warning("Column '%s' not found in DataFrame, skipping transformation", col)
             skipped_columns += 1
             continue
 
         try:
-            # Apply the transformation function
-            result_df = func(result_df, col)
-            successful_transformations += 1
-            logger.debug("Successfully applied %s to column '%s'", func.__name__, col)
-
-        except (pl.exceptions.ComputeError, pl.exceptions.ColumnNotFoundError) as e:
-            logger.warning(
-                "Transformation %s failed for column '%s': %s", 
-                func.__name__, col, e
-            )
-            failed_transformations += 1
+            exprs[col] = func(col, schema[col])
 
         except Exception as e:
             logger.error(
-                "Unexpected error during %s transformation of column '%s': %s", 
+                "Unexpected error building %s expression for column '%s': %s",
                 func.__name__, col, e
             )
+            # Keep the column unchanged
+            exprs[col] = pl.col(col)
             failed_transformations += 1
 
+    applied_transformations = len(exprs)
+
+    # Builders that turn unconvertible values into null expose unmapped(col, dtype);
+    # count those values on the source frame, so the data loss shows up in the logs
+    checks = {
+        col: transformations[col].unmapped(col, schema[col])
+        for col in exprs if hasattr(transformations[col], 'unmapped')
+    }
+    if checks:
+        unmapped_counts = df.lazy().select(**checks).collect().row(0, named=True)
+        for col, count in unmapped_counts.items():
+            if count:
+                logger.warning(
+                    "%d values of column '%s' cannot be converted by %s and become null",
+                    count, col, transformations[col].__name__
+                )
+
+    # Identity expressions (column already has the target dtype) are left out of
+    # with_columns(); select() still needs them to keep the column
+    if not project:
+        exprs = {col: expr for col, expr in exprs.items() if not expr.meta.eq(pl.col(col))}
+
+    lf = df.lazy()
+    try:
+        if project:
+            plan = lf.select(list(exprs.values()))
+        else:
+            plan = lf.with_columns(list(exprs.values()))
+        result_df = plan.collect(engine="streaming")
+
+    except pl.exceptions.PolarsError as e:
+        logger.warning("Fused transformation failed, locating failing columns: %s", e)
+
+        # Bisect to the offending columns and keep their original values
+        failing_columns = find_failing_columns(lf, exprs)
+        for col in failing_columns:
+            logger.warning(
+                "Transformation %s failed for column '%s'",
+                transformations[col].__name__, col
+            )
+            exprs[col] = pl.col(col)
+        failed_transformations += len(failing_columns)
+
+        if project:
+            plan = lf.select(list(exprs.values()))
+        else:
+            plan = lf.with_columns(list(exprs.values()))
+        result_df = plan.collect(engine="streaming")
+
     logger.info(
         "Transformations completed: %d successful, %d failed, %d skipped", 
-        successful_transformations, failed_transformations, skipped_columns
+        applied_transformations - failed_transformations, failed_transformations, skipped_columns
     )
 
     return result_df
 
 
+# Weights, volumes and areas are Numeric(5, 3) columns in database.py
+to_measure = decimal_expr(5, 3)
+
+# Enum-valued columns, categories taken from the database enum types
+to_localization = enum_expr(localization_enum)
+to_packaging_type = enum_expr(packaging_type_enum)
+to_model_code = enum_expr(model_codes_enum)
+to_model_name = enum_expr(model_names_enum)
+to_workshop_code = enum_expr(workshop_codes_enum)
+to_workshop_name = enum_expr(workshop_names_enum)
+
+# Packaging numbers, built from type and dimensions where the source has none
+to_box_number = packaging_number_expr('BOX')
+to_pallet_number = packaging_number_expr('PALLET')
+
+# main_df dataframe transformations definition
+MAIN_DF_TRANSFORMATIONS = {
+    'PART_NUMBER': string_expr,
+    'PART_NAME': clean_text_expr,
+    'PART_WEIGHT_KG': to_measure,
+    'PART_PER_VEHICLE': int64_expr,
+    'CONFIGURATION': string_expr,
+    'MODEL_CODE': to_model_code,
+    'MODEL_NAME': to_model_name,
+    'LINE_CODE': string_expr,
+    'LINE_NAME': string_expr,
+    'WORKSHOP_CODE': to_workshop_code,
+    'WORKSHOP_NAME': to_workshop_name,
+    'PART_PER_BOX': int64_expr,
+    'BOX_NUMBER': to_box_number,
+    'BOX_TYPE': to_packaging_type,
+    'BOX_WEIGHT_KG': to_measure,
+    'BOX_LENGTH_MM': int64_expr,
+    'BOX_WIDTH_MM': int64_expr,
+    'BOX_HEIGHT_MM': int64_expr,
+    'BOX_VOL_M3': to_measure,
+    'BOX_AREA_M2': to_measure,
+    'BOX_STACKING': int64_expr,
+    'BOX_PER_PALLET': int64_expr,
+    'PALLET_NUMBER': to_pallet_number,
+    'PALLET_TYPE': to_packaging_type,
+    'PALLET_WEIGHT_KG': to_measure,
+    'PALLET_LENGTH_MM': int64_expr,
+    'PALLET_WIDTH_MM': int64_expr,
+    'PALLET_HEIGHT_MM': int64_expr,
+    'PALLET_VOL_M3': to_measure,
+    'PALLET_AREA_M2': to_measure,
+    'PALLET_STACKING': int64_expr,
+    'SUPPLIER_NAME': clean_text_expr,
+    'LOCATION': string_expr,
+    'CITY': string_expr,
+    'STREET': string_expr,
+    'BUILDING': string_expr,
+    'LOCALIZATION': to_localization
+}
+
+# supplier_df dataframe transformations definition
+SUPPLIER_DF_TRANSFORMATIONS = {
+    'SUPPLIER_NAME': clean_text_expr,
+    'LOCATION': string_expr,
+    'CITY': string_expr,
+    'STREET': string_expr,
+    'BUILDING': string_expr,
+    'LOCALIZATION': to_localization
+}
+
+# part_df dataframe transformations definition
+PART_DF_TRANSFORMATIONS = {
+    'PART_NUMBER': string_expr,
+    'PART_NAME': clean_text_expr,
+    'PART_WEIGHT_KG': to_measure
+}
+
+# box_df dataframe transformations definition
+BOX_DF_TRANSFORMATIONS = {
+    'BOX_NUMBER': to_box_number,
+    'BOX_TYPE': to_packaging_type,
+    'BOX_WEIGHT_KG': to_measure,
+    'BOX_LENGTH_MM': int64_expr,
+    'BOX_WIDTH_MM': int64_expr,
+    'BOX_HEIGHT_MM': int64_expr,
+    'BOX_VOL_M3': to_measure,
+    'BOX_AREA_M2': to_measure,
+    'BOX_STACKING': int64_expr
+}
+
+# pallet_df dataframe transformations definition
+PALLET_DF_TRANSFORMATIONS = {
+    'PALLET_NUMBER': to_pallet_number,
+    'PALLET_TYPE': to_packaging_type,
+    'PALLET_WEIGHT_KG': to_measure,
+    'PALLET_LENGTH_MM': int64_expr,
+    'PALLET_WIDTH_MM': int64_expr,
+    'PALLET_HEIGHT_MM': int64_expr,
+    'PALLET_VOL_M3': to_measure,
+    'PALLET_AREA_M2': to_measure,
+    'PALLET_STACKING': int64_expr
+}
+
+# model_df dataframe transformations definition
+MODEL_DF_TRANSFORMATIONS = {
+    'MODEL_CODE': to_model_code,
+    'MODEL_NAME': to_model_name
+}
+
+# workshop_df dataframe transformations definition
+WORKSHOP_DF_TRANSFORMATIONS = {
+    'WORKSHOP_CODE': to_workshop_code,
+    'WORKSHOP_NAME': to_workshop_name
+}
+
+# line_df dataframe transformations definition
+LINE_DF_TRANSFORMATIONS = {
+    'LINE_CODE': string_expr,
+    'LINE_NAME': string_expr
+}
+
+# DataFrames processed by transformer(): (source key, transformations, result key, project)
+DATAFRAMES_TO_PROCESS = (
+    # main_df keeps its full schema: the loader reads key columns from it
+    ('main_df', MAIN_DF_TRANSFORMATIONS, 'transformed_main_df', False),
+    ('supplier_df', SUPPLIER_DF_TRANSFORMATIONS, 'transformed_supplier_df', True),
+    ('part_df', PART_DF_TRANSFORMATIONS, 'transformed_part_df', True),
+    ('box_df', BOX_DF_TRANSFORMATIONS, 'transformed_box_df', True),
+    ('pallet_df', PALLET_DF_TRANSFORMATIONS, 'transformed_pallet_df', True),
+    ('model_df', MODEL_DF_TRANSFORMATIONS, 'transformed_model_df', True),
+    ('workshop_df', WORKSHOP_DF_TRANSFORMATIONS, 'transformed_workshop_df', True),
+    ('line_df', LINE_DF_TRANSFORMATIONS, 'transformed_line_df', True)
+)
+
+
+def process_dataframe(
+        df_name: str,
+        df: pl.DataFrame | pl.LazyFrame,
+        transformations: Dict[str, Callable],
+        project: bool
+) -> pl.DataFrame:
+    '''
+    Function transforms a single DataFrame from the extractor output. Runs in a
+    worker thread of transformer().
+    
+    Arguments:
+    - df_name: Name of the DataFrame in the extractor output, used for logging
+    - df: polars DataFrame or LazyFrame instance to be transformed
+    - transformations: Dict[str, Callable[[str, pl.DataType], pl.Expr]]
+    - project: If True, keep only the columns listed in transformations
+    
+    Returns:
+    - transformed_df: Transformed DataFrame, or the original one if the
+      transformation fails
+    
+    Notes:
+    - The input is never inspected before the plan runs; empty frames simply
+      produce empty results, and the size is logged after collect()
+    '''
+    try:
+        # Apply transformations as a single lazy plan
+        transformed_df = apply_transformations(df.lazy(), transformations, project)
+        if transformed_df.is_empty():
+            logger.info("DataFrame '%s' is empty", df_name)
+        logger.info(
+            "Transformation of '%s' completed successfully: %d rows, %d columns",
+            df_name, transformed_df.height, transformed_df.width
+        )
+        return transformed_df
+
+    except (KeyError, AttributeError, TypeError) as e:
+        logger.error(
+            "Error processing DataFrame '%s': %s", 
+            df_name, e
+        )
+        # Return original DataFrame if transformation fails
+        logger.warning(
+            "Stored original DataFrame for '%s' due to transformation failure",
+            df_name
+        )
+        return df.lazy().collect()
+
+    except Exception as e:
+        logger.error(
+            "Unexpected error processing DataFrame '%s': %s", 
+            df_name, e
+        )
+        # Return original DataFrame if transformation fails
+        return df.lazy().collect()
+
+
 def transformer():
     '''
     Function applies data transformations to multiple DataFrames including type conversions
@@ -395,176 +931,54 @@ def transformer():
         * 'transformed_line_df': Transformed line DataFrame
     
     Transformation types applied:
-    - convert_to_int64: Converts to nullable integer type with null for missing values
-    - convert_to_string: Converts to string type with null for missing values
-    - convert_to_float: Converts to float type with rounding to 2 decimal places
-    - clean_text_column: Universal text cleaning with automatic Chinese detection and CamelCase processing
+    - int64_expr: Converts to nullable integer type with null for missing values
+    - string_expr: Converts to string type with null for missing values
+    - decimal_expr: Converts weights, volumes and areas to Decimal(5, 3)
+    - enum_expr: Converts enum-valued columns to polars Enum, unknown values to null (logged)
+    - packaging_number_expr: Fills missing box/pallet numbers from type and dimensions
+    - clean_text_expr: Universal text cleaning with automatic Chinese detection and CamelCase processing
     '''
     try:
+        # Cached results must not outlive one run of the pipeline
+        with _clean_text_lock:
+            _clean_text_cache.clear()
+
         common_df_dict = extractor()
         transformed_df_dict = {}
 
         # Ensure all DataFrames in common_df_dict are polars DataFrames
-        # If extractor returns pandas DataFrames, convert them to polars
+        # If extractor returns pandas DataFrames, convert them to polars through
+        # Arrow; pandas frames using dtype_backend='pyarrow' convert without a copy
         for df_name, df in common_df_dict.items():
             if not isinstance(df, pl.DataFrame):
                 try:
-                    common_df_dict[df_name] = pl.from_pandas(df)
+                    common_df_dict[df_name] = pl.from_arrow(
+                        pa.Table.from_pandas(df, preserve_index=False)
+                    )
                     logger.info("Converted '%s' from pandas to polars DataFrame", df_name)
                 except Exception as conversion_error:
                     logger.error("Failed to convert '%s' to polars: %s", df_name, conversion_error)
                     raise
 
-        # main_df dataframe transformations definition
-        main_df_transformations = {
-            'PART_NUMBER': convert_to_string,
-            'PART_NAME': clean_text_column,
-            'PART_WEIGHT_KG': convert_to_float,
-            'PART_PER_VEHICLE': convert_to_int64,
-            'CONFIGURATION': convert_to_string,
-            'MODEL_CODE': convert_to_string,
-            'MODEL_NAME': convert_to_string,
-            'LINE_CODE': convert_to_string,
-            'LINE_NAME': convert_to_string,
-            'WORKSHOP_CODE': convert_to_string,
-            'WORKSHOP_NAME': convert_to_string,
-            'PART_PER_BOX': convert_to_int64,
-            'BOX_NUMBER': convert_to_string,
-            'BOX_TYPE': convert_to_string,
-            'BOX_WEIGHT_KG': convert_to_float,
-            'BOX_LENGTH_MM': convert_to_int64,
-            'BOX_WIDTH_MM': convert_to_int64,
-            'BOX_HEIGHT_MM': convert_to_int64,
-            'BOX_VOL_M3': convert_to_float,
-            'BOX_AREA_M2': convert_to_float,
-            'BOX_STACKING': convert_to_int64,
-            'BOX_PER_PALLET': convert_to_int64,
-            'PALLET_NUMBER': convert_to_string,
-            'PALLET_TYPE': convert_to_string,
-            'PALLET_WEIGHT_KG': convert_to_float,
-            'PALLET_LENGTH_MM': convert_to_int64,
-            'PALLET_WIDTH_MM': convert_to_int64,
-            'PALLET_HEIGHT_MM': convert_to_int64,
-            'PALLET_VOL_M3': convert_to_float,
-            'PALLET_AREA_M2': convert_to_float,
-            'PALLET_STACKING': convert_to_int64,
-            'SUPPLIER_NAME': clean_text_column,
-            'LOCATION': convert_to_string,
-            'CITY': convert_to_string,
-            'STREET': convert_to_string,
-            'BUILDING': convert_to_string,
-            'LOCALIZATION': convert_to_string
-        }
-
-        # supplier_df dataframe transformations definition
-        supplier_df_transformations = {
-            'SUPPLIER_NAME': clean_text_column,
-            'LOCATION': convert_to_string,
-            'CITY': convert_to_string,
-            'STREET': convert_to_string,
-            'BUILDING': convert_to_string,
-            'LOCALIZATION': convert_to_string
-        }
-
-        # part_df dataframe transformations definition
-        part_df_transformations = {
-            'PART_NUMBER': convert_to_string,
-            'PART_NAME': clean_text_column,
-            'PART_WEIGHT_KG': convert_to_float
-        }
-
-        # box_df dataframe transformations definition
-        box_df_transformations = {
-            'BOX_NUMBER': convert_to_string,
-            'BOX_TYPE': convert_to_string,
-            'BOX_WEIGHT_KG': convert_to_float,
-            'BOX_LENGTH_MM': convert_to_int64,
-            'BOX_WIDTH_MM': convert_to_int64,
-            'BOX_HEIGHT_MM': convert_to_int64,
-            'BOX_VOL_M3': convert_to_float,
-            'BOX_AREA_M2': convert_to_float,
-            'BOX_STACKING': convert_to_int64
-        }
-
-        # pallet_df dataframe transformations definition
-        pallet_df_transformations = {
-            'PALLET_NUMBER': convert_to_string,
-            'PALLET_TYPE': convert_to_string,
-            'PALLET_WEIGHT_KG': convert_to_float,
-            'PALLET_LENGTH_MM': convert_to_int64,
-            'PALLET_WIDTH_MM': convert_to_int64,
-            'PALLET_HEIGHT_MM': convert_to_int64,
-            'PALLET_VOL_M3': convert_to_float,
-            'PALLET_AREA_M2': convert_to_float,
-            'PALLET_STACKING': convert_to_int64
-        }
-
-        # model_df dataframe transformations definition
-        model_df_transformations = {
-            'MODEL_CODE': convert_to_string,
-            'MODEL_NAME': convert_to_string
-        }
-
-        # workshop_df dataframe transformations definition
-        workshop_df_transformations = {
-            'WORKSHOP_CODE': convert_to_string,
-            'WORKSHOP_NAME': convert_to_string
-        }
-
-        # line_df dataframe transformations definition
-        line_df_transformations = {
-            'LINE_CODE': convert_to_string,
-            'LINE_NAME': convert_to_string
-        }
-
-        # Process each DataFrame with error handling
-        dataframes_to_process = [
-            ('main_df', main_df_transformations, 'transformed_main_df'),
-            ('supplier_df', supplier_df_transformations, 'transformed_supplier_df'),
-            ('part_df', part_df_transformations, 'transformed_part_df'),
-            ('box_df', box_df_transformations, 'transformed_box_df'),
-            ('pallet_df', pallet_df_transformations, 'transformed_pallet_df'),
-            ('model_df', model_df_transformations, 'transformed_model_df'),
-            ('workshop_df', workshop_df_transformations, 'transformed_workshop_df'),
-            ('line_df', line_df_transformations, 'transformed_line_df')
-        ]
-
-        for df_name, transformations, result_key in dataframes_to_process:
-            try:
-                if df_name not in common_df_dict:
-                    logger.warning("DataFrame '%s' not found in common_df_dict", df_name)
-                    continue
-
-                df = common_df_dict[df_name]
-                if df.is_empty():
-                    logger.info("DataFrame '%s' is empty, skipping transformation", df_name)
-                    transformed_df_dict[result_key] = df
-                    continue
-
-                # Apply transformations to the DataFrame
-                transformed_df = apply_transformations(df, transformations)
-                transformed_df_dict[result_key] = transformed_df
-                logger.info("Transformation of '%s' completed successfully", df_name)
-
-            except (KeyError, AttributeError, TypeError) as e:
-                logger.error(
-                    "Error processing DataFrame '%s': %s", 
-                    df_name, e
-                )
-                # Store original DataFrame if transformation fails
-                transformed_df_dict[result_key] = common_df_dict[df_name]
-                logger.warning(
-                    "Stored original DataFrame for '%s' due to transformation failure",
-                    df_name
-                )
-
-            except Exception as e:
-                logger.error(
-                    "Unexpected error processing DataFrame '%s': %s", 
-                    df_name, e
-                )
-                # Store original DataFrame if transformation fails
-                transformed_df_dict[result_key] = common_df_dict[df_name]
+        # Frames present in the extractor output, in processing order
+        jobs = []
+        for df_name, transformations, result_key, project in DATAFRAMES_TO_PROCESS:
+            if df_name not in common_df_dict:
+                logger.warning("DataFrame '%s' not found in common_df_dict", df_name)
+                continue
+            jobs.append((df_name, transformations, result_key, project))
+
+        # Polars releases the GIL while collecting, so frames are processed in parallel
+        max_workers = max(1, min(len(jobs), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                (result_key, pool.submit(
+                    process_dataframe, df_name, common_df_dict[df_name], transformations, project
+                ))
+                for df_name, transformations, result_key, project in jobs
+            ]
+            for result_key, future in futures:
+                transformed_df_dict[result_key] = future.result()
 
         logger.info(
             "All transformations completed. Processed %d DataFrames",
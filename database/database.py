@@ -40,7 +40,7 @@ STORED INFORMATION:
    - Dimensions: length, width, height (mm)
    - Calculated parameters: volume (m³), area (m²)
    - Weight and maximum stacking capability
-   - Automatic packaging number generation
+   - Packaging number built by the transformer from type and dimensions
 
 4. PRODUCTION (workshop_data, line_data):
    - Workshops: code (AS, COMP, PAINT, etc.) and name
@@ -59,7 +59,6 @@ IMPLEMENTATION FEATURES:
 
 - Automatic ID generation with prefixes (SUP_, PRT_, BOX_, etc.)
 - Business rule validation through CheckConstraint
-- Context-aware default values for packaging numbers
 - Enum type support for categorized data
 - Complete relationship mapping with back references (back_populates)
 
@@ -77,8 +76,7 @@ License: MIT
 Status: Production
 """
 
-import random
-import string
+import secrets
 from sqlalchemy import Column, ForeignKey, CheckConstraint, DateTime, func
 from sqlalchemy.types import String, SmallInteger, Numeric, Integer, Enum as SqlEnum
 from sqlalchemy.orm import relationship
@@ -89,40 +87,13 @@ Base = declarative_base()
 
 def generate_random_id(prefix):
     '''
-    Func generates a random ID with an arbitrary set of letters and numbers.
+    Func generates a random ID with an arbitrary set of URL-safe characters
+    (letters, numbers, '-' and '_').
     :param prefix: Prefix for identifying the record type ('SUP_', 'PRT_', 'MDL_', etc.)
     :return: Unique ID
     '''
-    random_part = ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(8))
-    return f"{prefix}{random_part}"
-
-def generate_box_number(context):
-    '''
-    Func generates BOX_NUMBER based on packaging type and dimensions.
-    Format: 'A 1340-560-440' or 'B 1340-560-440'
-    '''
-    params = context.get_current_parameters()
-    box_type = params.get('BOX_TYPE')
-    length = params.get('BOX_LENGTH_MM')
-    width = params.get('BOX_WIDTH_MM')
-    height = params.get('BOX_HEIGHT_MM')
-
-    prefix = 'A' if box_type == 'non-returnable' else 'B'
-    return f"{prefix} {length}-{width}-{height}"
-
-def generate_pallet_number(context):
-    '''
-    Func generates PALLET_NUMBER based on packaging type and dimensions.
-    Format: 'A 1340-1560-1440' or 'B 1340-1560-1440'
-    '''
-    params = context.get_current_parameters()
-    pallet_type = params.get('PALLET_TYPE')
-    length = params.get('PALLET_LENGTH_MM')
-    width = params.get('PALLET_WIDTH_MM')
-    height = params.get('PALLET_HEIGHT_MM')
-
-    prefix = 'A' if pallet_type == 'non-returnable' else 'B'
-    return f"{prefix} {length}-{width}-{height}"
+    # 6 random bytes encode to exactly 8 characters
+    return f"{prefix}{secrets.token_urlsafe(6)}"
 
 # Enum types
 localization_enum = SqlEnum('yes', 'no', name='localization')
@@ -172,7 +143,7 @@ class BoxData(Base):
     '''
     __tablename__ = 'box_data'
     BOX_ID = Column(String(12), primary_key=True, default=lambda: generate_random_id("BOX_"))
-    BOX_NUMBER = Column(String(50), default=generate_box_number)
+    BOX_NUMBER = Column(String(50))
     BOX_TYPE = Column(packaging_type_enum)
     BOX_WEIGHT_KG = Column(Numeric(5, 3), CheckConstraint('BOX_WEIGHT_KG >= 0'))
     BOX_LENGTH_MM = Column(SmallInteger)
@@ -191,7 +162,7 @@ class PalletData(Base):
     '''
     __tablename__ = 'pallet_data'
     PALLET_ID = Column(String(12), primary_key=True, default=lambda: generate_random_id("PLT_"))
-    PALLET_NUMBER = Column(String(50), default=generate_pallet_number)
+    PALLET_NUMBER = Column(String(50))
     PALLET_TYPE = Column(packaging_type_enum)
     PALLET_WEIGHT_KG = Column(Numeric(5, 3), CheckConstraint('PALLET_WEIGHT_KG >= 0'))
     PALLET_LENGTH_MM = Column(SmallInteger)
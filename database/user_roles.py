@@ -22,7 +22,8 @@ Key Features:
     - Connection testing and validation for each user type
     - Comprehensive error handling with specific SQLAlchemy exceptions
     - Environment-based configuration using .env files
-    - Safe resource management with automatic connection disposal
+    - One pooled admin engine per process, unpooled user engines disposed after use
+    - Safe resource management with automatic connection release
 
 Usage Example:
     >>> from user_roles import DatabaseAdmin, DatabaseEditor, DatabaseViewer
@@ -61,11 +62,11 @@ Security Notes:
     - All database operations use parameterized queries to prevent SQL injection
 
 Error Handling:
-    The module provides detailed error categorization:
-    - OperationalError: Connection and network issues
-    - ProgrammingError: SQL syntax and permission issues  
-    - DatabaseError: General database-related errors
-    - SQLAlchemyError: Framework-specific database errors
+    Database failures (SQLAlchemyError and its subclasses such as OperationalError
+    and ProgrammingError) are logged once and reported as a False/None result.
+    Creating a role that already exists raises RoleExistsError, so the caller
+    never grants privileges to, or hands out credentials for, someone else's role.
+    Any other exception is a bug and propagates to the caller.
 
 Version: 1.0.0
 Maintainer: PLD Engineering Center
@@ -75,27 +76,114 @@ License: MIT
 Status: Production
 """
 from pathlib import Path
+from functools import cache
 import os
 import logging
+import threading
 from sqlalchemy import create_engine, text
-from sqlalchemy.exc import SQLAlchemyError, OperationalError, ProgrammingError, DatabaseError
+from sqlalchemy.engine import Engine, URL
+from sqlalchemy.pool import NullPool
+from psycopg2 import sql
+from psycopg2.errorcodes import DUPLICATE_OBJECT
+from sqlalchemy.exc import SQLAlchemyError
 from dotenv import load_dotenv
 
 # Logger setup
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # The relative path to the root project directory
 project_path = Path(__file__).resolve().parents[1]
-
-# Load environment variables
 env_path = project_path / '.env'
-load_dotenv(env_path)
+
+
+@cache
+def _init_env():
+    """Load environment variables and configure logging on first use"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    load_dotenv(env_path)
+
+
+@cache
+def _admin_url():
+    """Build the admin connection URL once per process"""
+    _init_env()
+    return URL.create(
+        'postgresql+psycopg2',
+        username=os.getenv('DB_USER', 'postgres'),
+        password=os.getenv('DB_PASSWORD'),
+        host=os.getenv('DB_HOST', 'localhost'),
+        port=int(os.getenv('DB_PORT', '5432')),
+        database=os.getenv('DB_NAME', 'mft_db')
+    )
+
+
+class RoleExistsError(Exception):
+    """Raised when the role to create already exists in PostgreSQL"""
+
+
+# Engines shared by all DatabaseUser instances. Only admin credentials are
+# cached: user engines carry the user's password and must not outlive the role
+_ENGINE_CACHE: dict[tuple, Engine] = {}
+_ENGINE_CACHE_LOCK = threading.Lock()
+
+
+def _cached_engine(key, connection_string, **kwargs):
+    """Return the pooled engine for key, creating it on first use"""
+    with _ENGINE_CACHE_LOCK:
+        engine = _ENGINE_CACHE.get(key)
+        if engine is None:
+            options = {
+                'pool_size': 5,
+                'max_overflow': 10,
+                'pool_pre_ping': True,
+                'pool_recycle': 1800,
+                # Skips the hstore OID lookup on every new connection
+                'use_native_hstore': False
+            }
+            options.update(kwargs)
+            engine = create_engine(connection_string, **options)
+            _ENGINE_CACHE[key] = engine
+        return engine
+
+
+# Privilege scripts per role, formatted with quoted database and user identifiers
+ADMIN_GRANT_TEMPLATE = sql.SQL(
+    "GRANT ALL PRIVILEGES ON DATABASE {database} TO {user};\n"
+    "GRANT ALL PRIVILEGES ON SCHEMA public TO {user};\n"
+    "GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO {user};\n"
+    "GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO {user};\n"
+    "ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON TABLES TO {user};\n"
+    "ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON SEQUENCES TO {user}"
+)
+
+EDITOR_GRANT_TEMPLATE = sql.SQL(
+    "GRANT CONNECT ON DATABASE {database} TO {user};\n"
+    "GRANT USAGE ON SCHEMA public TO {user};\n"
+    "GRANT SELECT, INSERT, UPDATE ON ALL TABLES IN SCHEMA public TO {user};\n"
+    "GRANT USAGE ON ALL SEQUENCES IN SCHEMA public TO {user};\n"
+    "ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT SELECT, INSERT, UPDATE ON TABLES TO {user};\n"
+    "ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT USAGE ON SEQUENCES TO {user}"
+)
+
+VIEWER_GRANT_TEMPLATE = sql.SQL(
+    "GRANT CONNECT ON DATABASE {database} TO {user};\n"
+    "GRANT USAGE ON SCHEMA public TO {user};\n"
+    "GRANT SELECT ON ALL TABLES IN SCHEMA public TO {user};\n"
+    "GRANT SELECT ON ALL SEQUENCES IN SCHEMA public TO {user};\n"
+    "ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT SELECT ON TABLES TO {user};\n"
+    "ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT SELECT ON SEQUENCES TO {user}"
+)
+
 
 class DatabaseUser:
     """Base class for all database users"""
 
+    # Privilege script and its name in log messages, set by each subclass
+    _PRIVILEGES = None
+    _PRIVILEGE_LEVEL = ""
+
     def __init__(self, username, password, description=""):
+        _init_env()
         self.host = os.getenv('DB_HOST', 'localhost')
         self.port = os.getenv('DB_PORT', '5432')
         self.database = os.getenv('DB_NAME', 'mft_db')
@@ -107,54 +195,57 @@ class DatabaseUser:
         self.admin_user = os.getenv('DB_USER', 'postgres')
         self.admin_password = os.getenv('DB_PASSWORD')
 
+        # Connection URLs are fixed for the lifetime of the instance; URL.create
+        # escapes credentials containing '@', ':' or '/'
+        self._user_url = URL.create(
+            'postgresql+psycopg2',
+            username=self.username,
+            password=self.password,
+            host=self.host,
+            port=int(self.port),
+            database=self.database
+        )
+        self._connection_string = self._user_url.set(drivername='postgresql').render_as_string(hide_password=False)
+
+    @classmethod
+    def admin_engine(cls):
+        """Get the process-wide admin engine, creating it on first use"""
+        # Admin credentials are the same for every role, so one engine serves the
+        # process; admin operations are rare, so keep the pool small
+        return _cached_engine(
+            'admin', _admin_url(),
+            pool_size=2,
+            max_overflow=4,
+            isolation_level="AUTOCOMMIT"
+        )
+
     def get_admin_engine(self):
-        """Create engine with administrative privileges for user management"""
+        """Get the shared engine with administrative privileges for user management"""
         try:
-            connection_string = f"postgresql://{self.admin_user}:{self.admin_password}@{self.host}:{self.port}/{self.database}"
-            engine = create_engine(connection_string, isolation_level="AUTOCOMMIT")
-            return engine
-        except OperationalError as e:
-            logger.error("Operational error creating admin engine: %s", e)
-            return None
-        except DatabaseError as e:
-            logger.error("Database error creating admin engine: %s", e)
-            return None
-        except Exception as e:
-            logger.error("Unexpected error creating admin engine: %s", e)
+            return self.admin_engine()
+        except SQLAlchemyError as e:
+            logger.error("Error creating admin engine: %s", e)
             return None
 
     def get_user_engine(self):
-        """Create engine with user privileges for database operations"""
+        """Get an unpooled engine with user privileges; dispose it after use"""
         try:
-            connection_string = f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
-            engine = create_engine(connection_string)
-            return engine
-        except OperationalError as e:
-            logger.error("Operational error creating user engine for %s: %s", self.username, e)
-            return None
-        except DatabaseError as e:
-            logger.error("Database error creating user engine for %s: %s", self.username, e)
-            return None
-        except Exception as e:
-            logger.error("Unexpected error creating user engine for %s: %s", self.username, e)
+            # NullPool closes the backend connection as soon as it is released
+            return create_engine(self._user_url, poolclass=NullPool, use_native_hstore=False)
+        except SQLAlchemyError as e:
+            logger.error("Error creating user engine for %s: %s", self.username, e)
             return None
 
     def role_exists(self, engine):
-        """Check if user role exists"""
+        """Check if user role exists (introspection helper, not used by create_role)"""
         conn = None
         try:
             conn = engine.connect()
             result = conn.execute(
                 text("SELECT 1 FROM pg_roles WHERE rolname = :username"),
-                username=self.username
+                {"username": self.username}
             )
             return result.fetchone() is not None
-        except OperationalError as e:
-            logger.error("Operational error checking role %s: %s", self.username, e)
-            return False
-        except ProgrammingError as e:
-            logger.error("SQL error checking role %s: %s", self.username, e)
-            return False
         except SQLAlchemyError as e:
             logger.error("Database error checking role %s: %s", self.username, e)
             return False
@@ -162,55 +253,87 @@ class DatabaseUser:
             self._safe_close_connection(conn)
 
     def create_role(self, engine):
-        """Create user role in PostgreSQL"""
+        """Create user role in PostgreSQL, raising RoleExistsError if it already exists"""
         conn = None
         try:
-            if not self.role_exists(engine):
-                conn = engine.connect()
-                conn.execute(
-                    text("CREATE ROLE :username WITH LOGIN PASSWORD :password"),
-                    username=self.username, password=self.password
-                )
-                logger.info("Role '%s' created - %s", self.username, self.description)
-                return True
-            else:
-                logger.info("Role '%s' already exists", self.username)
-                return True
-        except ProgrammingError as e:
-            logger.error("SQL syntax error creating role '%s': %s", self.username, e)
-            return False
-        except OperationalError as e:
-            logger.error("Operational error creating role '%s': %s", self.username, e)
-            return False
+            conn = engine.connect()
+            statement = self.create_role_statement()
+            conn.execution_options(no_parameters=True).exec_driver_sql(
+                statement.as_string(conn.connection.dbapi_connection)
+            )
+            logger.info("Role '%s' created - %s", self.username, self.description)
+            return True
         except SQLAlchemyError as e:
+            # One round-trip and no race with a concurrent creator: let the server
+            # report an existing role instead of checking pg_roles first
+            if getattr(getattr(e, 'orig', None), 'pgcode', None) == DUPLICATE_OBJECT:
+                logger.info("Role '%s' already exists", self.username)
+                raise RoleExistsError(self.username) from e
             logger.error("Database error creating role '%s': %s", self.username, e)
             return False
         finally:
             self._safe_close_connection(conn)
 
     def _safe_close_connection(self, conn):
-        """Safely close connection if it exists and has close method"""
-        if conn and hasattr(conn, 'close') and callable(getattr(conn, 'close', None)):
-            try:
-                conn.close()
-            except Exception as e:
-                logger.warning("Error closing connection: %s", e)
+        """Safely close connection if it was opened"""
+        if conn is None:
+            return
+        try:
+            conn.close()
+        except Exception as e:
+            logger.warning("Error closing connection: %s", e)
 
     def _safe_dispose_engine(self, engine):
-        """Safely dispose engine if it exists and has dispose method"""
-        if engine and hasattr(engine, 'dispose') and callable(getattr(engine, 'dispose', None)):
-            try:
-                engine.dispose()
-            except Exception as e:
-                logger.warning("Error disposing engine: %s", e)
+        """Safely dispose engine if it was created"""
+        if engine is None:
+            return
+        try:
+            engine.dispose()
+        except Exception as e:
+            logger.warning("Error disposing engine: %s", e)
+
+    def create_role_statement(self):
+        """Build the CREATE ROLE statement for this user"""
+        # Identifiers cannot be bound parameters, so quote them client-side
+        return sql.SQL("CREATE ROLE {} WITH LOGIN PASSWORD {}").format(
+            sql.Identifier(self.username), sql.Literal(self.password)
+        )
+
+    def privileges_script(self):
+        """Build the privilege script described by the subclass _PRIVILEGES template"""
+        if self._PRIVILEGES is None:
+            raise NotImplementedError("Subclasses must define _PRIVILEGES")
+        return self._PRIVILEGES.format(
+            database=sql.Identifier(self.database), user=sql.Identifier(self.username)
+        )
 
     def grant_privileges(self, engine):
-        """Grant privileges - to be implemented by subclasses"""
-        raise NotImplementedError("Subclasses must implement grant_privileges method")
+        """Grant the privileges described by the subclass _PRIVILEGES script"""
+        script = self.privileges_script()
+
+        conn = None
+        try:
+            conn = engine.connect()
+
+            # Send all statements as one script to make a single round-trip
+            with conn.begin():
+                conn.execution_options(no_parameters=True).exec_driver_sql(
+                    script.as_string(conn.connection.dbapi_connection)
+                )
+
+            logger.info("%s privileges granted for '%s'", self._PRIVILEGE_LEVEL.capitalize(), self.username)
+            return True
 
-    def create_db_user(self):
-        """Create user with appropriate privileges"""
-        engine = self.get_admin_engine()
+        except SQLAlchemyError as e:
+            logger.error("Error granting %s privileges for '%s': %s", self._PRIVILEGE_LEVEL, self.username, e)
+            return False
+        finally:
+            self._safe_close_connection(conn)
+
+    def create_db_user(self, engine=None):
+        """Create user with appropriate privileges, on engine or the shared admin engine"""
+        if engine is None:
+            engine = self.get_admin_engine()
         if not engine:
             return False
 
@@ -227,20 +350,9 @@ class DatabaseUser:
                        self.username, self.__class__.__name__)
             return True
 
-        except ProgrammingError as e:
-            logger.error("SQL syntax error creating user '%s': %s", self.username, e)
-            return False
-        except OperationalError as e:
-            logger.error("Operational error creating user '%s': %s", self.username, e)
-            return False
         except SQLAlchemyError as e:
             logger.error("Database error creating user '%s': %s", self.username, e)
             return False
-        except Exception as e:
-            logger.error("Unexpected error creating user '%s': %s", self.username, e)
-            return False
-        finally:
-            self._safe_dispose_engine(engine)
 
     def test_connection(self):
         """Test if user can connect to database"""
@@ -255,121 +367,43 @@ class DatabaseUser:
             conn.execute(text("SELECT 1"))
             logger.info("Connection test successful for user '%s'", self.username)
             return True
-        except OperationalError as e:
-            logger.error("Operational error - connection test failed for user '%s': %s", self.username, e)
-            return False
-        except ProgrammingError as e:
-            logger.error("Permission error - connection test failed for user '%s': %s", self.username, e)
-            return False
         except SQLAlchemyError as e:
             logger.error("Database error - connection test failed for user '%s': %s", self.username, e)
             return False
-        except Exception as e:
-            logger.error("Unexpected error - connection test failed for user '%s': %s", self.username, e)
-            return False
         finally:
             self._safe_close_connection(conn)
             self._safe_dispose_engine(engine)
 
     def get_connection_string(self):
         """Get connection string for this user"""
-        return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
+        return self._connection_string
 
 
 class DatabaseAdmin(DatabaseUser):
     """Administrative user with full database access"""
 
+    _PRIVILEGES = ADMIN_GRANT_TEMPLATE
+    _PRIVILEGE_LEVEL = "administrative"
+
     def __init__(self, username, password, description="Administrative role - full database access"):
         super().__init__(username, password, description)
 
-    def grant_privileges(self, engine):
-        """Grant full administrative privileges"""
-        conn = None
-        try:
-            conn = engine.connect()
-            privileges = [
-                f"GRANT ALL PRIVILEGES ON DATABASE {self.database} TO {self.username}",
-                f"GRANT ALL PRIVILEGES ON SCHEMA public TO {self.username}",
-                f"GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO {self.username}",
-                f"GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO {self.username}",
-                f"ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON TABLES TO {self.username}",
-                f"ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON SEQUENCES TO {self.username}"
-            ]
-
-            for privilege in privileges:
-                conn.execute(text(privilege))
-
-            logger.info("Administrative privileges granted for '%s'", self.username)
-            return True
-
-        except SQLAlchemyError as e:
-            logger.error("Error granting administrative privileges for '%s': %s", self.username, e)
-            return False
-        finally:
-            self._safe_close_connection(conn)
-
 
 class DatabaseEditor(DatabaseUser):
     """Editor user with read, insert, and update privileges"""
 
+    _PRIVILEGES = EDITOR_GRANT_TEMPLATE
+    _PRIVILEGE_LEVEL = "editor"
+
     def __init__(self, username, password, description="Role for data addition and modification"):
         super().__init__(username, password, description)
 
-    def grant_privileges(self, engine):
-        """Grant read, insert, and update privileges"""
-        conn = None
-        try:
-            conn = engine.connect()
-            privileges = [
-                f"GRANT CONNECT ON DATABASE {self.database} TO {self.username}",
-                f"GRANT USAGE ON SCHEMA public TO {self.username}",
-                f"GRANT SELECT, INSERT, UPDATE ON ALL TABLES IN SCHEMA public TO {self.username}",
-                f"GRANT USAGE ON ALL SEQUENCES IN SCHEMA public TO {self.username}",
-                f"ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT SELECT, INSERT, UPDATE ON TABLES TO {self.username}",
-                f"ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT USAGE ON SEQUENCES TO {self.username}"
-            ]
-
-            for privilege in privileges:
-                conn.execute(text(privilege))
-
-            logger.info("Editor privileges granted for '%s'", self.username)
-            return True
-
-        except SQLAlchemyError as e:
-            logger.error("Error granting editor privileges for '%s': %s", self.username, e)
-            return False
-        finally:
-            self._safe_close_connection(conn)
-
 
 class DatabaseViewer(DatabaseUser):
     """Viewer user with read-only privileges"""
 
+    _PRIVILEGES = VIEWER_GRANT_TEMPLATE
+    _PRIVILEGE_LEVEL = "viewer"
+
     def __init__(self, username, password, description="Role for data viewing - SELECT only"):
         super().__init__(username, password, description)
-
-    def grant_privileges(self, engine):
-        """Grant read-only privileges"""
-        conn = None
-        try:
-            conn = engine.connect()
-            privileges = [
-                f"GRANT CONNECT ON DATABASE {self.database} TO {self.username}",
-                f"GRANT USAGE ON SCHEMA public TO {self.username}",
-                f"GRANT SELECT ON ALL TABLES IN SCHEMA public TO {self.username}",
-                f"GRANT SELECT ON ALL SEQUENCES IN SCHEMA public TO {self.username}",
-                f"ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT SELECT ON TABLES TO {self.username}",
-                f"ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT SELECT ON SEQUENCES TO {self.username}"
-            ]
-
-            for privilege in privileges:
-                conn.execute(text(privilege))
-
-            logger.info("Viewer privileges granted for '%s'", self.username)
-            return True
-
-        except SQLAlchemyError as e:
-            logger.error("Error granting viewer privileges for '%s': %s", self.username, e)
-            return False
-        finally:
-            self._safe_close_connection(conn)
@@ -0,0 +1,60 @@
+'''
+Gunicorn settings for the Flask endpoints.
+
+Usage:
+    gunicorn -c endpoints/gunicorn.conf.py 'endpoints.upload_api:create_app()'
+    gunicorn -c endpoints/gunicorn.conf.py 'endpoints.user_manager_api:create_app()'
+'''
+import multiprocessing
+import os
+
+bind = os.getenv('API_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('API_WORKERS', multiprocessing.cpu_count()))
+
+# Gevent workers yield while a request waits on Airflow or PostgreSQL, so one
+# worker serves many requests concurrently. Set API_WORKER_CLASS=gthread to fall
+# back to OS threads.
+worker_class = os.getenv('API_WORKER_CLASS', 'gevent')
+worker_connections = int(os.getenv('API_WORKER_CONNECTIONS', '100'))
+threads = int(os.getenv('API_THREADS', '8'))
+timeout = 60
+
+# Reuse client connections between requests
+keepalive = 5
+
+# The app is imported in each worker after gevent has patched the stdlib; the
+# apps load .env, start logging and build their engines there, so each worker
+# gets its own pools and log listener
+preload_app = False
+
+
+def _gevent_wait_callback(conn, timeout=None):
+    '''
+    Func waits for a psycopg2 connection through the gevent hub instead of
+    blocking the whole worker
+    '''
+    from gevent.socket import wait_read, wait_write
+    from psycopg2 import OperationalError, extensions
+
+    while True:
+        state = conn.poll()
+        if state == extensions.POLL_OK:
+            break
+        if state == extensions.POLL_READ:
+            wait_read(conn.fileno(), timeout=timeout)
+        elif state == extensions.POLL_WRITE:
+            wait_write(conn.fileno(), timeout=timeout)
+        else:
+            raise OperationalError(f'Bad result from poll: {state!r}')
+
+
+def post_worker_init(worker):
+    '''
+    Func makes psycopg2 cooperative once the gevent worker has patched the stdlib
+    '''
+    if worker_class != 'gevent':
+        return
+
+    from psycopg2 import extensions
+    extensions.set_wait_callback(_gevent_wait_callback)
+    worker.log.info('psycopg2 gevent wait callback installed')
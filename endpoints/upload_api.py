@@ -1,28 +1,68 @@
 import os
+import shutil
 import tempfile
 import logging
+from functools import cache
+from itertools import cycle
 from pathlib import Path
 
 import requests
-from flask import Flask, request, jsonify
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Blueprint, Flask, current_app, request, jsonify
 from dotenv import load_dotenv
 
 # Logs configuration
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Load environment variables
+# Path to environment variables
 current_directory = Path(__file__).resolve().parent.parent.parent
 env_path = current_directory / '.env'
-load_dotenv(dotenv_path=env_path)
 
-# Create Flask application
-app = Flask(__name__)
+# Upload routes, registered on the application built by create_app()
+upload_bp = Blueprint('upload', __name__)
 
-# Set the secret key from environment variable
-app.secret_key = os.getenv('FLASK_SECRET_KEY')
+# Default for the largest accepted upload, overridden by UPLOAD_MAX_BYTES
+DEFAULT_MAX_UPLOAD_SIZE = 50 * 1024 * 1024
 
-@app.route('/upload-excel', methods=['POST'])
+# Chunk size used when writing uploads to disk
+COPY_BUFFER_SIZE = 1 << 20
+
+# Number of pre-created subdirectories uploads are spread across
+UPLOAD_SLOT_COUNT = 64
+
+# Keep-alive session reused for every Airflow DAG trigger
+AIRFLOW = requests.Session()
+AIRFLOW.auth = ('airflow', 'airflow')
+AIRFLOW.mount('http://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    # Only failed connects are retried: the request never reached Airflow. A DAG
+    # trigger is not idempotent, so 5xx responses to the POST are not retried
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+@cache
+def _init_env():
+    '''
+    Func loads environment variables and configures logging once per process
+    '''
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    load_dotenv(dotenv_path=env_path)
+
+@upload_bp.before_request
+def reject_oversized_upload():
+    '''
+    Func rejects requests whose declared Content-Length exceeds MAX_CONTENT_LENGTH
+    before Werkzeug spools the body to disk
+    '''
+    max_size = current_app.config['MAX_CONTENT_LENGTH']
+    if request.content_length is not None and request.content_length > max_size:
+        logger.error('Размер файла превышает допустимый: %s байт.', request.content_length)
+        return jsonify({'error': 'Размер файла превышает допустимый'}), 413
+    return None
+
+@upload_bp.route('/upload-excel', methods=['POST'])
 def upload_excel():
     '''
     Func accepts only specific file named "sample_mft_data.xlsx"
@@ -45,21 +85,23 @@ def upload_excel():
         logger.error('Только файлы формата *.xlsx разрешены.')
         return jsonify({'error': 'Только файлы формата *.xlsx разрешены'}), 400
 
-    # Create a temporary file
-    temp_dir = tempfile.mkdtemp()
-    temp_file_path = os.path.join(temp_dir, file.filename)
-    file.save(temp_file_path)
+    # Stream the upload into a uniquely named file in the next upload slot,
+    # in 1 MiB chunks instead of going through file.save()
+    with tempfile.NamedTemporaryFile(
+        dir=next(current_app.config['UPLOAD_SLOTS']), suffix='.xlsx', delete=False
+    ) as out:
+        shutil.copyfileobj(file.stream, out, length=COPY_BUFFER_SIZE)
+        temp_file_path = out.name
 
     try:
         # Send request to Airflow
-        response = requests.post(
+        response = AIRFLOW.post(
             'http://localhost:8080/api/v1/dags/excel_processing_dag/dagRuns',
             json={
                 'conf': {'file_path': temp_file_path},
                 'execution_date': 'NOW'
             },
-            auth=('airflow', 'airflow'),
-            timeout=10  # Response timeout in seconds
+            timeout=(3, 10)  # Connect and response timeouts in seconds
         )
 
         if response.status_code != 200:
@@ -72,5 +114,29 @@ def upload_excel():
         # Temporary file will be cleaned up by the DAG task
         pass
 
-if __name__ == '__main__':
-    app.run(debug=True)
+def create_app():
+    '''
+    Func builds the Flask application, served by gunicorn as
+    "endpoints.upload_api:create_app()" (see endpoints/gunicorn.conf.py)
+    '''
+    _init_env()
+    app = Flask(__name__)
+
+    # Set the secret key from environment variable
+    app.secret_key = os.getenv('FLASK_SECRET_KEY')
+
+    # Largest accepted upload, enforced before the multipart body is parsed
+    app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('UPLOAD_MAX_BYTES', str(DEFAULT_MAX_UPLOAD_SIZE)))
+
+    # Directory shared with the Airflow workers, which delete each file after the run
+    app.config['UPLOAD_DIR'] = os.getenv('AIRFLOW_UPLOAD_DIR', tempfile.gettempdir())
+
+    # Slot directories are created once and reused by every worker and restart,
+    # so concurrent uploads do not all contend on one directory
+    slots = [os.path.join(app.config['UPLOAD_DIR'], f'mft_slot_{i:02d}') for i in range(UPLOAD_SLOT_COUNT)]
+    for slot in slots:
+        os.makedirs(slot, exist_ok=True)
+    app.config['UPLOAD_SLOTS'] = cycle(slots)
+
+    app.register_blueprint(upload_bp)
+    return app
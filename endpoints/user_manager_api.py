@@ -6,6 +6,7 @@ with different privilege levels through Flask endpoints.
 
 Endpoints:
     POST /api/users/create - Create a new user with specified role
+    POST /api/users/create_bulk - Create several users in one transaction
     GET /api/users/test-connection/<username> - Test user connection
     GET /api/users/list - Get list of all users
     DELETE /api/users/delete/<username> - Delete a user
@@ -28,16 +29,33 @@ Usage example:
     Testing connection:
     GET /api/users/test-connection/sys_admin
 
+    Creating several users at once:
+    POST /api/users/create_bulk
+    {
+        "users": [
+            {"username": "data_manager", "password": "editor_pass_123", "role": "editor"},
+            {"username": "report_user", "password": "viewer_pass_123", "role": "viewer"}
+        ]
+    }
+
     Getting user list:
     GET /api/users/list
 
     Deleting a user:
     DELETE /api/users/delete/sys_admin
 
+Running:
+    Production: gunicorn -c endpoints/gunicorn.conf.py 'endpoints.user_manager_api:create_app()'
+    Development: FLASK_ENV=development python -m endpoints.user_manager_api
+
 Environment requirements:
-    - Installed libraries: Flask, SQLAlchemy, python-dotenv, psycopg2-binary
+    - Installed libraries: Flask, SQLAlchemy, python-dotenv, psycopg2-binary, orjson
     - Configured .env file with database connection parameters
+    - LOG_LEVEL: logging level, WARNING by default (set INFO to log successful operations)
     - Access to PostgreSQL with administrative privileges
+    - DB_READER_USER / DB_READER_PASSWORD (optional): plain LOGIN role without
+      memberships used by the read-only endpoints (pg_roles is readable by PUBLIC),
+      the administrative credentials are used when it is not set
 
 Version: 1.0.0
 Maintainer: PLD Engineering Center
@@ -47,49 +65,270 @@ License: MIT
 Status: Production
 """
 import os
+from functools import cache
+import re
+import time
+import queue
+import atexit
 import logging
-from flask import Flask, request, jsonify
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+import psycopg2
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from sqlalchemy import create_engine, text
-from sqlalchemy.exc import SQLAlchemyError, OperationalError, ProgrammingError, IntegrityError
+from sqlalchemy.engine import URL
+from sqlalchemy.exc import SQLAlchemyError, OperationalError, ProgrammingError, DBAPIError
+from psycopg2 import sql
+from psycopg2.errorcodes import UNDEFINED_OBJECT, DEPENDENT_OBJECTS_STILL_EXIST, OBJECT_IN_USE, DUPLICATE_OBJECT
 from dotenv import load_dotenv
+import orjson
 
 # Import user classes from user_roles.py
-from database.user_roles import DatabaseAdmin, DatabaseEditor, DatabaseViewer
+from database.user_roles import DatabaseAdmin, DatabaseEditor, DatabaseViewer, RoleExistsError
 
-# Logger setup
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-# Load environment variables
 env_path = os.path.join(os.path.dirname(__file__), '.env')
-load_dotenv(env_path)
+
+
+@cache
+def _init_env():
+    """
+    Load environment variables and start logging once per process. Runs in the
+    gunicorn worker (create_app() or first use), never in the master before fork
+    """
+    load_dotenv(env_path)
+
+    # Request threads only enqueue records, a background listener formats and
+    # writes them, so log I/O never blocks a request
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(log_queue, log_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'WARNING').upper(),
+        handlers=[queue_handler]
+    )
+
+def _json_default(obj):
+    """Serialize values unknown to the JSON encoder, dates as ISO 8601"""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+def dumps_json(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON with orjson"""
+    return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes responses with dumps_json"""
+
+    ensure_ascii = False
+
+    def dumps(self, obj, **kwargs):
+        return dumps_json(obj).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_json(obj), mimetype=self.mimetype)
 
 # Create Flask application
 app = Flask(__name__)
-app.config['JSON_AS_ASCII'] = False
+app.json = FastJSONProvider(app)
+
+@cache
+def _engines():
+    """
+    Build the process-wide connection pools reused by every request: an
+    AUTOCOMMIT admin engine for role management, also passed to
+    DatabaseUser.create_db_user() so there is one admin pool per worker, and a
+    reader engine for read-only queries
+    """
+    _init_env()
+    connection_url = URL.create(
+        'postgresql+psycopg2',
+        username=os.getenv('DB_USER', 'postgres'),
+        password=os.getenv('DB_PASSWORD'),
+        host=os.getenv('DB_HOST', 'localhost'),
+        port=int(os.getenv('DB_PORT', '5432')),
+        database=os.getenv('DB_NAME', 'mft_db')
+    )
+
+    # Plain login role without memberships for the read-only endpoints; falls
+    # back to the admin credentials when it is not configured
+    if os.getenv('DB_READER_USER'):
+        reader_url = connection_url.set(
+            username=os.getenv('DB_READER_USER'),
+            password=os.getenv('DB_READER_PASSWORD')
+        )
+    else:
+        reader_url = connection_url
+
+    pool_options = {
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_pre_ping': True,
+        'pool_recycle': 1800
+    }
+    return (
+        create_engine(connection_url, isolation_level="AUTOCOMMIT", **pool_options),
+        create_engine(reader_url, **pool_options)
+    )
+
+# Statements shared by the handlers, built once instead of per request
+_Q_ROLE_INFO = text("""
+    SELECT 
+        rolname as username,
+        rolsuper as is_superuser,
+        rolcanlogin as can_login,
+        rolcreatedb as can_create_db,
+        rolcreaterole as can_create_roles
+    FROM pg_roles 
+    WHERE rolname = :username
+""")
+# Run on a raw psycopg2 named cursor, so it is plain SQL rather than text()
+_LIST_USERS_SQL = """
+    SELECT 
+        rolname as username,
+        rolsuper as is_superuser,
+        rolcanlogin as can_login,
+        rolcreatedb as can_create_db,
+        rolcreaterole as can_create_roles,
+        rolconnlimit as connection_limit,
+        rolvaliduntil as password_valid_until
+    FROM pg_roles 
+    WHERE rolcanlogin = true 
+    ORDER BY rolname
+"""
+_Q_EXISTING_ROLES = text("SELECT rolname FROM pg_roles WHERE rolname = ANY(:usernames)")
+_Q_HEALTH = text("SELECT 1")
+_Q_SERVER_INFO = text("SELECT version(), current_database()")
+
+# Server version and database name do not change while the pool is alive, so
+# they are read on the first successful health check and reused afterwards
+_DB_STATIC = {}
+
+# Existence check, revocation of the privileges granted by user_roles.py and
+# DROP ROLE in a single round-trip. DO blocks take no parameters, so the role
+# name is bound into a transaction-local setting and the statement text stays
+# the same for every role.
+_Q_DELETE_ROLE = text("""
+SELECT set_config('mft.delete_role', :username, true);
+DO $$
+DECLARE
+    target text := current_setting('mft.delete_role');
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = target) THEN
+        RAISE EXCEPTION USING ERRCODE = 'undefined_object', MESSAGE = 'role not found';
+    END IF;
+    EXECUTE format('REVOKE ALL PRIVILEGES ON DATABASE %I FROM %I', current_database(), target);
+    EXECUTE format('REVOKE ALL PRIVILEGES ON SCHEMA public FROM %I', target);
+    EXECUTE format('REVOKE ALL PRIVILEGES ON ALL TABLES IN SCHEMA public FROM %I', target);
+    EXECUTE format('REVOKE ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public FROM %I', target);
+    EXECUTE format('ALTER DEFAULT PRIVILEGES IN SCHEMA public REVOKE ALL ON TABLES FROM %I', target);
+    EXECUTE format('ALTER DEFAULT PRIVILEGES IN SCHEMA public REVOKE ALL ON SEQUENCES FROM %I', target);
+    EXECUTE format('DROP ROLE %I', target);
+END
+$$;
+""")
+
+# Request validation, built once at import
+_VALID_ROLES = frozenset(('admin', 'editor', 'viewer'))
+_ROLE_CTORS = {
+    'admin': DatabaseAdmin,
+    'editor': DatabaseEditor,
+    'viewer': DatabaseViewer
+}
+# Longest accepted role name, below PostgreSQL's 63 byte identifier limit
+MAX_USERNAME_LENGTH = 50
+_IDENT_RE = re.compile(rf'\A[A-Za-z_][A-Za-z0-9_]{{0,{MAX_USERNAME_LENGTH - 1}}}\Z')
+
+# Fixed error responses, serialized once at import. Flask builds a fresh
+# Response from the (body, status, headers) tuple on every return
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+def _static_error(message, status):
+    """Serialize a fixed error message into a Flask response tuple"""
+    return dumps_json({'success': False, 'error': message}), status, _JSON_HEADERS
+
+_ERR_NO_JSON = _static_error('Content-Type must be application/json', 415)
+_ERR_NO_BODY = _static_error('JSON request body is required', 400)
+_ERR_NO_USERS = _static_error('JSON request body with a non-empty "users" list is required', 400)
+_ERR_DUPLICATE_USERS = _static_error('Usernames must be unique', 400)
+_ERR_NO_USERNAME = _static_error('Username is required', 400)
+_ERR_DB_CONNECTION = _static_error('Database connection failed', 500)
+_ERR_DB_QUERY = _static_error('Database query error', 500)
+_ERR_INTERNAL = _static_error('Internal server error', 500)
+_ERR_NOT_FOUND = _static_error('Endpoint not found', 404)
+_ERR_METHOD_NOT_ALLOWED = _static_error('Method not allowed for this endpoint', 405)
+
+# Validation messages of _build_user that do not depend on the request
+_USER_ERRORS = {
+    message: _static_error(message, 400)
+    for message in (
+        'User description must be a JSON object',
+        'Missing required field: username',
+        'Missing required field: password',
+        'Missing required field: role',
+        'Username cannot be empty',
+        f'Username must be {MAX_USERNAME_LENGTH} characters or less',
+        'Username must start with a letter or underscore and contain only letters, digits and underscores',
+        'Password cannot be empty',
+        f'Invalid role. Valid values: {", ".join(_ROLE_CTORS)}'
+    )
+}
+
+def _build_user(data):
+    """
+    Validate one user description from a request body.
+
+    Returns:
+        (user, role, None) when valid, (None, None, error message) otherwise
+    """
+    if not isinstance(data, dict):
+        return None, None, 'User description must be a JSON object'
+
+    for field in ('username', 'password', 'role'):
+        if field not in data:
+            return None, None, f'Missing required field: {field}'
+
+    username = data['username'].strip()
+    password = data['password']
+    role = data['role'].lower().strip()
+    description = data.get('description', '')
+
+    # User name validation
+    if not username:
+        return None, None, 'Username cannot be empty'
+
+    if len(username) > MAX_USERNAME_LENGTH:
+        return None, None, f'Username must be {MAX_USERNAME_LENGTH} characters or less'
+
+    if not _IDENT_RE.match(username):
+        return None, None, 'Username must start with a letter or underscore and contain only letters, digits and underscores'
+
+    # Password validation
+    if not password:
+        return None, None, 'Password cannot be empty'
+
+    # Role validation
+    if role not in _VALID_ROLES:
+        return None, None, f'Invalid role. Valid values: {", ".join(_ROLE_CTORS)}'
 
-# Configuration from environment variables
-DB_HOST = os.getenv('DB_HOST', 'localhost')
-DB_PORT = os.getenv('DB_PORT', '5432')
-DB_NAME = os.getenv('DB_NAME', 'mft_db')
-DB_USER = os.getenv('DB_USER', 'postgres')
-DB_PASSWORD = os.getenv('DB_PASSWORD')
+    return _ROLE_CTORS[role](username, password, description), role, None
 
 def get_admin_engine():
-    """Create connection with administrative privileges"""
-    try:
-        connection_string = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-        engine = create_engine(connection_string, isolation_level="AUTOCOMMIT")
-        return engine
-    except OperationalError as e:
-        logger.error("Database connection error: %s", e)
-        return None
-    except Exception as e:
-        logger.error("Unexpected error creating engine: %s", e)
-        return None
+    """Get the shared engine with administrative privileges"""
+    return _engines()[0]
+
+def get_reader_engine():
+    """Get the shared engine for read-only queries"""
+    return _engines()[1]
 
 @app.route('/api/users/create', methods=['POST'])
 def create_user():
@@ -99,71 +338,24 @@ def create_user():
     try:
         # Check JSON
         if not request.is_json:
-            return jsonify({
-                'success': False,
-                'error': 'Content-Type must be application/json'
-            }), 415
+            return _ERR_NO_JSON
 
         data = request.get_json()
         if not data:
-            return jsonify({
-                'success': False,
-                'error': 'JSON request body is required'
-            }), 400
-
-        required_fields = ['username', 'password', 'role']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({
-                    'success': False,
-                    'error': f'Missing required field: {field}'
-                }), 400
-
-        username = data['username'].strip()
-        password = data['password']
-        role = data['role'].lower().strip()
-        description = data.get('description', '')
-
-        # User name validation
-        if not username:
-            return jsonify({
-                'success': False,
-                'error': 'Username cannot be empty'
-            }), 400
-
-        if len(username) > 50:  # PostgreSQL limit for role names
-            return jsonify({
-                'success': False,
-                'error': 'Username must be 50 characters or less'
-            }), 400
-
-        # Password validation
-        if not password:
-            return jsonify({
-                'success': False,
-                'error': 'Password cannot be empty'
-            }), 400
-
-        # Role validation
-        valid_roles = ['admin', 'editor', 'viewer']
-        if role not in valid_roles:
-            return jsonify({
-                'success': False,
-                'error': f'Invalid role. Valid values: {", ".join(valid_roles)}'
-            }), 400
+            return _ERR_NO_BODY
 
         # Creating user objects
-        if role == 'admin':
-            user = DatabaseAdmin(username, password, description)
-        elif role == 'editor':
-            user = DatabaseEditor(username, password, description)
-        else:  # viewer
-            user = DatabaseViewer(username, password, description)
+        user, role, error = _build_user(data)
+        if error:
+            return _USER_ERRORS[error]
+        username = user.username
+        description = user.description
 
         # Creating users in database
-        result = user.create_db_user()
+        result = user.create_db_user(get_admin_engine())
 
         if result:
+            _invalidate_user_list()
             logger.info("User '%s' successfully created with role '%s'", username, role)
             return jsonify({
                 'success': True,
@@ -196,82 +388,137 @@ def create_user():
             'error': f'Invalid value: {str(e)}'
         }), 400
 
+    except RoleExistsError:
+        logger.warning("User '%s' already exists", username)
+        return jsonify({
+            'success': False,
+            'error': f'User {username} already exists'
+        }), 409
+
+    except OperationalError as e:
+        logger.error("Database error creating user: %s", e)
+        return _ERR_DB_CONNECTION
+
     except SQLAlchemyError as e:
         logger.error("Database error creating user: %s", e)
-        if isinstance(e, IntegrityError):
-            return jsonify({
-                'success': False,
-                'error': f'User {username} already exists'
-            }), 409
-        elif isinstance(e, OperationalError):
-            return jsonify({
-                'success': False,
-                'error': 'Database connection failed'
-            }), 500
-        else:
-            return jsonify({
-                'success': False,
-                'error': f'Database error: {str(e)}'
-            }), 500
+        return jsonify({
+            'success': False,
+            'error': f'Database error: {str(e)}'
+        }), 500
 
     except Exception as e:
         logger.error("Unexpected error creating user: %s", e)
+        return _ERR_INTERNAL
+
+@app.route('/api/users/create_bulk', methods=['POST'])
+def create_users_bulk():
+    """
+    Create several database users in one transaction and one round-trip
+    """
+    try:
+        # Check JSON
+        if not request.is_json:
+            return _ERR_NO_JSON
+
+        data = request.get_json()
+        items = data.get('users') if isinstance(data, dict) else None
+        if not items or not isinstance(items, list):
+            return _ERR_NO_USERS
+
+        users = []
+        for index, item in enumerate(items):
+            user, role, error = _build_user(item)
+            if error:
+                return jsonify({
+                    'success': False,
+                    'error': f'users[{index}]: {error}'
+                }), 400
+            users.append((user, role))
+
+        usernames = [user.username for user, _ in users]
+        if len(set(usernames)) != len(usernames):
+            return _ERR_DUPLICATE_USERS
+
+        with get_admin_engine().connect() as connection:
+            existing = [row[0] for row in connection.execute(_Q_EXISTING_ROLES, {'usernames': usernames})]
+            if existing:
+                return jsonify({
+                    'success': False,
+                    'error': f'Users already exist: {", ".join(sorted(existing))}'
+                }), 409
+
+            statements = []
+            for user, _ in users:
+                statements.append(user.create_role_statement())
+                statements.append(user.privileges_script())
+
+            # A multi-statement query runs in one implicit transaction, so either
+            # every user is created or none is
+            script = sql.SQL(';\n').join(statements)
+            connection.execution_options(no_parameters=True).exec_driver_sql(
+                script.as_string(connection.connection.dbapi_connection)
+            )
+
+        _invalidate_user_list()
+        logger.info("%d users created in bulk", len(users))
+        return jsonify({
+            'success': True,
+            'users': [
+                {
+                    'username': user.username,
+                    'role': role,
+                    'description': user.description,
+                    'connection_string': user.get_connection_string()
+                }
+                for user, role in users
+            ],
+            'count': len(users)
+        }), 201
+
+    except OperationalError as e:
+        logger.error("Database connection error creating users in bulk: %s", e)
+        return _ERR_DB_CONNECTION
+
+    except SQLAlchemyError as e:
+        # A concurrent request created one of the roles after the existence check
+        if getattr(getattr(e, 'orig', None), 'pgcode', None) == DUPLICATE_OBJECT:
+            logger.warning("Role created concurrently during bulk creation: %s", e)
+            return jsonify({
+                'success': False,
+                'error': 'One of the users already exists'
+            }), 409
+        logger.error("Database error creating users in bulk: %s", e)
         return jsonify({
             'success': False,
-            'error': 'Internal server error'
+            'error': f'Database error: {str(e)}'
         }), 500
 
+    except Exception as e:
+        logger.error("Unexpected error creating users in bulk: %s", e)
+        return _ERR_INTERNAL
+
 @app.route('/api/users/test-connection/<username>', methods=['GET'])
 def test_user_connection(username: str):
     """
     Test user connection to database
     """
-    engine = None
     try:
         if not username or not username.strip():
-            return jsonify({
-                'success': False,
-                'error': 'Username is required'
-            }), 400
+            return _ERR_NO_USERNAME
 
         username = username.strip()
 
-        engine = get_admin_engine()
-        if not engine:
-            return jsonify({
-                'success': False,
-                'error': 'Failed to connect to database'
-            }), 500
+        with get_reader_engine().connect() as connection:
+            # Columns are aliased to the response keys, so the row maps directly
+            user_info = connection.execute(_Q_ROLE_INFO, {'username': username}).mappings().first()
 
-        with engine.connect() as connection:
-            query = text("""
-                SELECT 
-                    rolname,
-                    rolsuper,
-                    rolcanlogin,
-                    rolcreatedb,
-                    rolcreaterole
-                FROM pg_roles 
-                WHERE rolname = :username
-            """)
-            result = connection.execute(query, {'username': username})
-            user_info = result.fetchone()
-
-            if not user_info:
+            if user_info is None:
                 return jsonify({
                     'success': False,
                     'error': f'User {username} not found'
                 }), 404
 
-            user_info_dict = {
-                'rolname': user_info[0],
-                'rolsuper': user_info[1],
-                'rolcanlogin': user_info[2],
-                'rolcreatedb': user_info[3],
-                'rolcreaterole': user_info[4]
-            }
-
-            if not user_info_dict['rolcanlogin']:
+            if not user_info['can_login']:
                 return jsonify({
                     'success': False,
                     'error': f'User {username} does not have login permission'
@@ -280,127 +527,158 @@ def test_user_connection(username: str):
             return jsonify({
                 'success': True,
                 'message': f'User {username} exists and can connect',
-                'user_info': {
-                    'username': user_info_dict['rolname'],
-                    'is_superuser': user_info_dict['rolsuper'],
-                    'can_login': user_info_dict['rolcanlogin'],
-                    'can_create_db': user_info_dict['rolcreatedb'],
-                    'can_create_roles': user_info_dict['rolcreaterole']
-                }
+                'user_info': dict(user_info)
             })
 
     except OperationalError as e:
         logger.error("Database connection error testing user %s: %s", username, e)
-        return jsonify({
-            'success': False,
-            'error': 'Database connection failed'
-        }), 500
+        return _ERR_DB_CONNECTION
 
     except ProgrammingError as e:
         logger.error("SQL error testing user %s: %s", username, e)
-        return jsonify({
-            'success': False,
-            'error': 'Database query error'
-        }), 500
+        return _ERR_DB_QUERY
 
     except Exception as e:
         logger.error("Unexpected error testing user %s: %s", username, e)
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error'
-        }), 500
+        return _ERR_INTERNAL
+
+# Rows fetched from the server-side cursor per round-trip when listing users
+LIST_USERS_BATCH_SIZE = 1000
+
+# Rendered /api/users/list body, reused for USER_LIST_CACHE_TTL seconds. Roles
+# created or deleted through this process bump the generation, which drops the
+# cached body and keeps responses already in flight from storing a stale one.
+_LIST_CACHE = {'at': 0.0, 'payload': None, 'generation': 0}
+
+@cache
+def _list_cache_ttl():
+    """Read USER_LIST_CACHE_TTL once the environment is loaded"""
+    _init_env()
+    return float(os.getenv('USER_LIST_CACHE_TTL', '15'))
+
+def _invalidate_user_list():
+    """Drop the cached user list after a role was created or deleted"""
+    _LIST_CACHE['generation'] += 1
+    _LIST_CACHE['payload'] = None
+
+def _user_row(row):
+    """Map a _LIST_USERS_SQL row to its JSON object"""
+    return {
+        'username': row[0],
+        'is_superuser': row[1],
+        'can_login': row[2],
+        'can_create_db': row[3],
+        'can_create_roles': row[4],
+        'connection_limit': row[5],
+        # Same str() format as before the switch to orjson, which would
+        # otherwise encode the timestamp as ISO 8601
+        'password_valid_until': str(row[6]) if row[6] else None
+    }
 
+def _release_cursor(connection, transaction, cursor):
+    """Close the named cursor, end its transaction and return the connection to the pool"""
+    try:
+        cursor.close()
     finally:
-        if engine:
-            engine.dispose()
+        try:
+            transaction.rollback()
+        finally:
+            connection.close()
+
+def _stream_users(cursor, rows):
+    """
+    Yield the user list as JSON, starting with the prefetched first batch and
+    then one batch of rows at a time, and cache the full body once it is sent
+    """
+    generation = _LIST_CACHE['generation']
+    parts = [b'{"users": [']
+    yield parts[-1]
+
+    count = 0
+    try:
+        while rows:
+            parts.append((b', ' if count else b'') + b', '.join(dumps_json(_user_row(row)) for row in rows))
+            yield parts[-1]
+            count += len(rows)
+            rows = cursor.fetchmany(LIST_USERS_BATCH_SIZE)
+    except psycopg2.Error as e:
+        # The 200 status is already sent, so close the document as a failure
+        logger.error("Database error streaming user list: %s", e)
+        yield f'], "count": {count}, "success": false, "error": "Database query error"}}'.encode('utf-8')
+        return
+
+    parts.append(f'], "count": {count}, "success": true}}'.encode('utf-8'))
+    yield parts[-1]
+
+    if generation == _LIST_CACHE['generation']:
+        _LIST_CACHE['payload'] = b''.join(parts)
+        _LIST_CACHE['at'] = time.monotonic()
 
 @app.route('/api/users/list', methods=['GET'])
 def list_users():
     """
     Get list of all database users
     """
-    engine = None
-    try:
-        connection_string = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-        engine = create_engine(connection_string)
-
-        with engine.connect() as connection:
-            query = text("""
-                SELECT 
-                    rolname as username,
-                    rolsuper as is_superuser,
-                    rolcanlogin as can_login,
-                    rolcreatedb as can_create_db,
-                    rolcreaterole as can_create_roles,
-                    rolconnlimit as connection_limit,
-                    rolvaliduntil as password_valid_until
-                FROM pg_roles 
-                WHERE rolcanlogin = true 
-                ORDER BY rolname
-            """)
-            result = connection.execute(query)
-            users = []
-
-            for row in result:
-                users.append({
-                    'username': row[0],
-                    'is_superuser': row[1],
-                    'can_login': row[2],
-                    'can_create_db': row[3],
-                    'can_create_roles': row[4],
-                    'connection_limit': row[5],
-                    'password_valid_until': str(row[6]) if row[6] else None
-                })
+    payload = _LIST_CACHE['payload']
+    if payload is not None and time.monotonic() - _LIST_CACHE['at'] < _list_cache_ttl():
+        return Response(payload, mimetype='application/json')
 
-            return jsonify({
-                'success': True,
-                'users': users,
-                'count': len(users)
-            })
-
-    except OperationalError as e:
+    try:
+        # A named psycopg2 cursor keeps the result set on the server and hands
+        # back typed tuples without building SQLAlchemy rows. It lives in the
+        # explicit transaction of this checkout, so the fixed name cannot clash
+        # with another request; _release_cursor ends both together
+        connection = get_reader_engine().connect()
+        try:
+            transaction = connection.begin()
+            cursor = connection.connection.dbapi_connection.cursor(name='list_users_cur')
+            try:
+                cursor.itersize = LIST_USERS_BATCH_SIZE
+                cursor.execute(_LIST_USERS_SQL)
+                # Fetched before the response starts, so errors still map to a status
+                rows = cursor.fetchmany(LIST_USERS_BATCH_SIZE)
+            except BaseException:
+                cursor.close()
+                raise
+        except BaseException:
+            connection.close()
+            raise
+
+        response = Response(
+            stream_with_context(_stream_users(cursor, rows)),
+            mimetype='application/json'
+        )
+        # Runs when the server closes the response, also if the body was never
+        # iterated (HEAD request, client disconnect)
+        response.call_on_close(lambda: _release_cursor(connection, transaction, cursor))
+        return response
+
+    except (OperationalError, psycopg2.OperationalError) as e:
         logger.error("Database connection error getting user list: %s", e)
-        return jsonify({
-            'success': False,
-            'error': 'Database connection failed'
-        }), 500
+        return _ERR_DB_CONNECTION
 
-    except ProgrammingError as e:
+    except (ProgrammingError, psycopg2.ProgrammingError) as e:
         logger.error("SQL error getting user list: %s", e)
-        return jsonify({
-            'success': False,
-            'error': 'Database query error'
-        }), 500
+        return _ERR_DB_QUERY
 
     except Exception as e:
         logger.error("Unexpected error getting user list: %s", e)
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error'
-        }), 500
-
-    finally:
-        if engine:
-            engine.dispose()
+        return _ERR_INTERNAL
 
 @app.route('/api/users/delete/<username>', methods=['DELETE'])
 def delete_user(username: str):
     """
     Delete a database user
     """
-    engine = None
     try:
         # User name validation
         if not username or not username.strip():
-            return jsonify({
-                'success': False,
-                'error': 'Username is required'
-            }), 400
+            return _ERR_NO_USERNAME
 
         username = username.strip()
 
         # Check for protected users
-        protected_users = [DB_USER, 'postgres']
+        protected_users = [get_admin_engine().url.username, 'postgres']
         if username in protected_users:
             return jsonify({
                 'success': False,
@@ -415,35 +693,27 @@ def delete_user(username: str):
             }), 500
 
         with engine.connect() as connection:
-            # Verifying the user's existence
-            check_query = text("SELECT 1 FROM pg_roles WHERE rolname = :username")
-            result = connection.execute(check_query, {'username': username})
+            try:
+                # Verifying the user's existence, revocation of privileges and
+                # deleting a role in one statement
+                connection.execute(_Q_DELETE_ROLE, {'username': username})
 
-            if not result.fetchone():
-                return jsonify({
-                    'success': False,
-                    'error': f'User {username} not found'
-                }), 404
+            except DBAPIError as e:
+                pgcode = getattr(e.orig, 'pgcode', None)
+                if pgcode == UNDEFINED_OBJECT:
+                    return jsonify({
+                        'success': False,
+                        'error': f'User {username} not found'
+                    }), 404
 
-            try:
-                # Revocation of privileges
-                revoke_query = text(f"REVOKE ALL PRIVILEGES FROM {username}")
-                connection.execute(revoke_query)
-
-                # Deleting a role
-                delete_query = text(f"DROP ROLE IF EXISTS {username}")
-                connection.execute(delete_query)
-
-            except ProgrammingError as e:
-                error_msg = str(e)
-                # Check if the user has active connections.
-                if "cannot be dropped" in error_msg and "has dependent objects" in error_msg:
+                # Check if the user owns objects or has active connections
+                if pgcode == DEPENDENT_OBJECTS_STILL_EXIST:
                     logger.error("User %s has dependent objects: %s", username, e)
                     return jsonify({
                         'success': False,
                         'error': f'Cannot delete user {username} because they own database objects. Reassign or drop objects first.'
                     }), 409
-                elif "cannot be dropped" in error_msg and "active sessions" in error_msg:
+                elif pgcode == OBJECT_IN_USE:
                     logger.error("User %s has active sessions: %s", username, e)
                     return jsonify({
                         'success': False,
@@ -452,6 +722,7 @@ def delete_user(username: str):
                 else:
                     raise
 
+            _invalidate_user_list()
             logger.info("User '%s' successfully deleted", username)
             return jsonify({
                 'success': True,
@@ -460,10 +731,7 @@ def delete_user(username: str):
 
     except OperationalError as e:
         logger.error("Database connection error deleting user %s: %s", username, e)
-        return jsonify({
-            'success': False,
-            'error': 'Database connection failed'
-        }), 500
+        return _ERR_DB_CONNECTION
 
     except ProgrammingError as e:
         logger.error("SQL error deleting user %s: %s", username, e)
@@ -474,38 +742,26 @@ def delete_user(username: str):
 
     except Exception as e:
         logger.error("Unexpected error deleting user %s: %s", username, e)
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error'
-        }), 500
-
-    finally:
-        if engine:
-            engine.dispose()
+        return _ERR_INTERNAL
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Check API and database connection health"""
-    engine = None
     try:
-        connection_string = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-        engine = create_engine(connection_string)
-
-        with engine.connect() as connection:
-            result = connection.execute(text("SELECT version(), current_timestamp, current_database()"))
-            row = result.fetchone()
-            db_version = row[0]
-            timestamp = row[1]
-            db_name = row[2]
+        with get_reader_engine().connect() as connection:
+            if _DB_STATIC:
+                connection.execute(_Q_HEALTH)
+            else:
+                row = connection.execute(_Q_SERVER_INFO).fetchone()
+                _DB_STATIC.update(version=row[0], name=row[1])
 
             return jsonify({
                 'status': 'healthy',
                 'message': 'API and database are working normally',
                 'database': {
                     'available': True,
-                    'version': db_version,
-                    'name': db_name,
-                    'timestamp': str(timestamp)
+                    **_DB_STATIC,
+                    'timestamp': str(datetime.now(timezone.utc))
                 }
             })
 
@@ -528,27 +784,34 @@ def health_check():
             'database': 'unknown'
         }), 500
 
-    finally:
-        if engine:
-            engine.dispose()
-
 @app.errorhandler(404)
 def not_found(_error):
     """Handler for non-existent endpoints"""
-    return jsonify({
-        'success': False,
-        'error': 'Endpoint not found'
-    }), 404
+    return _ERR_NOT_FOUND
 
 @app.errorhandler(405)
 def method_not_allowed(_error):
     """Handler for invalid HTTP methods"""
-    return jsonify({
-        'success': False,
-        'error': 'Method not allowed for this endpoint'
-    }), 405
+    return _ERR_METHOD_NOT_ALLOWED
+
+def create_app():
+    """
+    Prepare the process and return the Flask application, served by gunicorn as
+    "endpoints.user_manager_api:create_app()" (see endpoints/gunicorn.conf.py)
+    """
+    _init_env()
+    return app
 
 if __name__ == '__main__':
+    create_app()
+
+    # Werkzeug's server is for local development only, production runs under gunicorn
+    if os.getenv('FLASK_ENV') != 'development':
+        raise SystemExit(
+            "Run in production with: gunicorn -c endpoints/gunicorn.conf.py 'endpoints.user_manager_api:create_app()' "
+            "(set FLASK_ENV=development to use the development server)"
+        )
+
     host = os.getenv('FLASK_HOST', '0.0.0.0')
     port_str = os.getenv('FLASK_PORT', '5000')
     port = int(port_str)
@@ -556,6 +819,6 @@ if __name__ == '__main__':
 
     logger.info("Starting User Manager API on %s:%s", host, port)
     logger.info("Debug mode: %s", debug)
-    logger.info("Database connection: %s:%s/%s", DB_HOST, DB_PORT, DB_NAME)
+    logger.info("Database connection: %s", get_admin_engine().url)
 
     app.run(host=host, port=port, debug=debug)
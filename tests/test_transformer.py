@@ -0,0 +1,87 @@
+"""
+Tests for the expression builders and helpers of the transformer module.
+"""
+from pathlib import Path
+import sys
+
+import polars as pl
+
+# The relative path to the root project directory
+project_path = Path(__file__).resolve().parents[1]
+if str(project_path) not in sys.path:
+    sys.path.insert(0, str(project_path))
+
+from dags.tasks.transformer import (
+    apply_transformations, find_failing_columns, titlecase_series,
+    to_box_number, to_measure, to_packaging_type, to_workshop_name
+)
+
+
+def box_df(numbers, types):
+    return pl.DataFrame({
+        'BOX_NUMBER': numbers,
+        'BOX_TYPE': types,
+        'BOX_LENGTH_MM': ['600'] * len(numbers),
+        'BOX_WIDTH_MM': ['400.0'] * len(numbers),
+        'BOX_HEIGHT_MM': [' 300'] * len(numbers)
+    })
+
+
+def test_blank_numbers_are_generated():
+    df = box_df(['', '   ', None], ['n_returnable', 'returnable', ''])
+    result = apply_transformations(df, {'BOX_NUMBER': to_box_number})
+    assert result['BOX_NUMBER'].to_list() == [
+        'A 600-400-300',
+        'B 600-400-300',
+        'B 600-400-300'
+    ]
+
+
+def test_source_numbers_are_kept():
+    df = box_df(['X 1-2-3', ''], ['non-returnable', 'non-returnable'])
+    result = apply_transformations(df, {'BOX_NUMBER': to_box_number})
+    assert result['BOX_NUMBER'].to_list() == ['X 1-2-3', 'A 600-400-300']
+
+
+def test_enum_aliases_are_mapped():
+    df = pl.DataFrame({
+        'BOX_TYPE': ['n_returnable', ' returnable ', 'non-returnable'],
+        'WORKSHOP_NAME': ['Paint', 'Assembly', 'Painting']
+    })
+    result = apply_transformations(df, {'BOX_TYPE': to_packaging_type, 'WORKSHOP_NAME': to_workshop_name})
+    assert result['BOX_TYPE'].to_list() == ['non-returnable', 'returnable', 'non-returnable']
+    assert result['WORKSHOP_NAME'].to_list() == ['Painting', 'Assembly', 'Painting']
+    assert isinstance(result['BOX_TYPE'].dtype, pl.Enum)
+
+
+def test_enum_unknown_values_become_null_and_are_logged(caplog):
+    df = pl.DataFrame({'BOX_TYPE': ['returnable', 'crate', '', None]})
+    result = apply_transformations(df, {'BOX_TYPE': to_packaging_type})
+    assert result['BOX_TYPE'].to_list() == ['returnable', None, None, None]
+    # Only the non-blank unknown value counts as lost
+    assert "1 values of column 'BOX_TYPE'" in caplog.text
+
+
+def test_decimal_out_of_range_values_become_null_and_are_logged(caplog):
+    df = pl.DataFrame({'BOX_WEIGHT_KG': ['1.5', ' 99.999 ', '100', '99.9996', '1e300', 'abc', '', None]})
+    result = apply_transformations(df, {'BOX_WEIGHT_KG': to_measure})
+    assert result['BOX_WEIGHT_KG'].dtype == pl.Decimal(5, 3)
+    assert [None if v is None else str(v) for v in result['BOX_WEIGHT_KG'].to_list()] == [
+        '1.500', '99.999', None, None, None, None, None, None
+    ]
+    assert "4 values of column 'BOX_WEIGHT_KG'" in caplog.text
+
+
+def test_titlecase_series_matches_polars():
+    s = pl.Series('PART_NAME', [
+        'front bumper', 'Front Bumper', 'REAR DOOR', 'передняя дверь',
+        'mixed Кузов panel', 'o\'neil-bracket', '', None
+    ])
+    assert titlecase_series(s).to_list() == s.str.to_titlecase().to_list()
+
+
+def test_find_failing_columns_bisects_to_bad_expressions():
+    lf = pl.LazyFrame({'a': ['1', '2'], 'b': ['x', 'y'], 'c': ['3', '4'], 'd': ['z', '5']})
+    exprs = {col: pl.col(col).cast(pl.Int64, strict=True) for col in ['a', 'b', 'c', 'd']}
+    assert find_failing_columns(lf, exprs) == ['b', 'd']
+    assert find_failing_columns(lf, {'a': exprs['a']}) == []
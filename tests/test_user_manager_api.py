@@ -0,0 +1,140 @@
+"""
+Tests for the error mapping and bulk creation of the user manager API.
+The database is replaced by mocked engine connections.
+"""
+from pathlib import Path
+import sys
+from unittest import mock
+
+import pytest
+from psycopg2 import sql
+from psycopg2.errorcodes import (
+    DUPLICATE_OBJECT, UNDEFINED_OBJECT, DEPENDENT_OBJECTS_STILL_EXIST, OBJECT_IN_USE
+)
+from sqlalchemy.exc import ProgrammingError, InternalError, OperationalError
+
+# The relative path to the root project directory
+project_path = Path(__file__).resolve().parents[1]
+if str(project_path) not in sys.path:
+    sys.path.insert(0, str(project_path))
+
+from database.user_roles import DatabaseUser, DatabaseViewer, RoleExistsError
+import endpoints.user_manager_api as api
+
+
+class PgError(Exception):
+    """DBAPI error carrying a SQLSTATE like psycopg2 errors do"""
+
+    def __init__(self, pgcode):
+        super().__init__(pgcode)
+        self.pgcode = pgcode
+
+
+@pytest.fixture
+def client():
+    return api.app.test_client()
+
+
+@pytest.fixture
+def admin_connection():
+    """Connection returned by the admin engine, also usable as a context manager"""
+    connection = mock.MagicMock()
+    connection.__enter__.return_value = connection
+    with mock.patch.object(api.get_admin_engine(), 'connect', return_value=connection), \
+            mock.patch.object(sql.Composed, 'as_string', return_value='SCRIPT'):
+        yield connection
+
+
+def test_create_role_raises_role_exists_error(admin_connection):
+    admin_connection.execution_options.return_value.exec_driver_sql.side_effect = ProgrammingError(
+        'CREATE ROLE', {}, PgError(DUPLICATE_OBJECT)
+    )
+    with pytest.raises(RoleExistsError):
+        DatabaseViewer('report_user', 'secret').create_role(api.get_admin_engine())
+
+
+def test_create_existing_user_returns_409(client):
+    with mock.patch.object(DatabaseUser, 'create_db_user', side_effect=RoleExistsError('report_user')):
+        response = client.post('/api/users/create', json={
+            'username': 'report_user', 'password': 'secret', 'role': 'viewer'
+        })
+    assert response.status_code == 409
+    assert response.get_json() == {'success': False, 'error': 'User report_user already exists'}
+
+
+@pytest.mark.parametrize('pgcode, status', [
+    (UNDEFINED_OBJECT, 404),
+    (DEPENDENT_OBJECTS_STILL_EXIST, 409),
+    (OBJECT_IN_USE, 409)
+])
+def test_delete_maps_sqlstate(client, admin_connection, pgcode, status):
+    admin_connection.execute.side_effect = InternalError('DO', {}, PgError(pgcode))
+    response = client.delete('/api/users/delete/report_user')
+    assert response.status_code == status
+    assert response.get_json()['success'] is False
+
+
+def test_delete_runs_do_block_with_username(client, admin_connection):
+    response = client.delete('/api/users/delete/report_user')
+    assert response.status_code == 200
+    statement, params = admin_connection.execute.call_args[0]
+    assert statement is api._Q_DELETE_ROLE
+    assert params == {'username': 'report_user'}
+    assert "ERRCODE = 'undefined_object'" in statement.text
+
+
+def test_delete_connection_error_returns_500(client, admin_connection):
+    admin_connection.execute.side_effect = OperationalError('DO', {}, PgError(None))
+    response = client.delete('/api/users/delete/report_user')
+    assert response.status_code == 500
+    assert response.get_json()['error'] == 'Database connection failed'
+
+
+BULK_USERS = [
+    {'username': 'data_manager', 'password': 'editor_pass', 'role': 'editor'},
+    {'username': 'report_user', 'password': 'viewer_pass', 'role': 'Viewer'}
+]
+
+
+def test_bulk_create_sends_one_script(client, admin_connection):
+    admin_connection.execute.return_value = []
+    response = client.post('/api/users/create_bulk', json={'users': BULK_USERS})
+
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body['count'] == 2
+    assert [(user['username'], user['role']) for user in body['users']] == [
+        ('data_manager', 'editor'), ('report_user', 'viewer')
+    ]
+    # Every CREATE ROLE and grant goes out in a single statement
+    admin_connection.execution_options.return_value.exec_driver_sql.assert_called_once_with('SCRIPT')
+
+
+def test_bulk_create_rejects_existing_roles(client, admin_connection):
+    admin_connection.execute.return_value = [('report_user',)]
+    response = client.post('/api/users/create_bulk', json={'users': BULK_USERS})
+
+    assert response.status_code == 409
+    assert response.get_json()['error'] == 'Users already exist: report_user'
+    admin_connection.execution_options.return_value.exec_driver_sql.assert_not_called()
+
+
+def test_bulk_create_maps_concurrent_duplicate_to_409(client, admin_connection):
+    admin_connection.execute.return_value = []
+    admin_connection.execution_options.return_value.exec_driver_sql.side_effect = ProgrammingError(
+        'CREATE ROLE', {}, PgError(DUPLICATE_OBJECT)
+    )
+    response = client.post('/api/users/create_bulk', json={'users': BULK_USERS})
+    assert response.status_code == 409
+
+
+@pytest.mark.parametrize('payload, error', [
+    ({'users': []}, 'JSON request body with a non-empty "users" list is required'),
+    ({'users': BULK_USERS + BULK_USERS[:1]}, 'Usernames must be unique'),
+    ({'users': [{'username': 'x', 'password': 'p', 'role': 'boss'}]},
+     'users[0]: Invalid role. Valid values: admin, editor, viewer')
+])
+def test_bulk_create_validation(client, payload, error):
+    response = client.post('/api/users/create_bulk', json=payload)
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error